@@ -76,3 +76,24 @@ def fixture_migrator(mock_dependencies):
         mock_dependencies["state"],
         mock_dependencies["base_path"],
     )
+
+
+@pytest.fixture(name="aws_cli_on_path")
+def fixture_aws_cli_on_path(monkeypatch):
+    """Make migrate_v2's AWS CLI lookup succeed without touching PATH."""
+    monkeypatch.setattr("shutil.which", lambda cmd: "/usr/bin/aws")
+
+
+@pytest.fixture(name="patched_phases")
+def fixture_patched_phases(monkeypatch, aws_cli_on_path):
+    """Stub migrate_v2's phase runners and environment checks, returning the phases run in order."""
+    called = []
+    monkeypatch.setattr("migrate_v2.scan_all_buckets", lambda s3, state, interrupted: called.append("scan"))
+    monkeypatch.setattr("migrate_v2.request_all_restores", lambda s3, state, interrupted: called.append("restore"))
+    monkeypatch.setattr("migrate_v2.wait_for_restores", lambda s3, state, interrupted: called.append("wait"))
+    monkeypatch.setattr(
+        "migrate_v2.migrate_all_buckets",
+        lambda s3, state, base_path, drive_checker, interrupted: called.append("migrate"),
+    )
+    monkeypatch.setattr("migrate_v2.check_drive_available", lambda base_path: None)
+    return called
@@ -8,6 +8,17 @@ across audit and optimization scripts.
 # Constants for EBS pricing
 GP3_DEFAULT_THROUGHPUT_MBS = 125  # Default throughput for gp3 volumes
 
+# Pricing per GB-month (us-east-1)
+EBS_COST_PER_GB_MONTH = {
+    "gp3": 0.08,  # General Purpose SSD (gp3)
+    "gp2": 0.10,  # General Purpose SSD (gp2)
+    "io1": 0.125,  # Provisioned IOPS SSD (io1)
+    "io2": 0.125,  # Provisioned IOPS SSD (io2)
+    "st1": 0.045,  # Throughput Optimized HDD
+    "sc1": 0.025,  # Cold HDD
+    "standard": 0.05,  # Magnetic
+}
+
 
 def calculate_ebs_volume_cost(size_gb: int, volume_type: str, iops: int = 0, throughput: int = 0) -> float:
     """
@@ -32,26 +43,14 @@ def calculate_ebs_volume_cost(size_gb: int, volume_type: str, iops: int = 0, thr
         Throughput pricing:
         - gp3: Free for first 125 MB/s, then $0.04 per MB/s/month
     """
-    # Pricing per GB-month (us-east-1)
-    cost_per_gb = {
-        "gp3": 0.08,  # General Purpose SSD (gp3)
-        "gp2": 0.10,  # General Purpose SSD (gp2)
-        "io1": 0.125,  # Provisioned IOPS SSD (io1)
-        "io2": 0.125,  # Provisioned IOPS SSD (io2)
-        "st1": 0.045,  # Throughput Optimized HDD
-        "sc1": 0.025,  # Cold HDD
-        "standard": 0.05,  # Magnetic
-    }
-
     # Calculate base storage cost
-    if volume_type not in cost_per_gb:
-        raise ValueError(f"Unknown volume type: {volume_type}. " f"Supported types: {', '.join(sorted(cost_per_gb.keys()))}")
-    rate = cost_per_gb[volume_type]
-    base_cost = size_gb * rate
+    if volume_type not in EBS_COST_PER_GB_MONTH:
+        raise ValueError(f"Unknown volume type: {volume_type}. " f"Supported types: {', '.join(sorted(EBS_COST_PER_GB_MONTH))}")
+    base_cost = size_gb * EBS_COST_PER_GB_MONTH[volume_type]
 
     # Add IOPS costs for io1/io2 volumes
     # io1/io2 include 3 IOPS per GB for free, additional IOPS charged at $0.065/month
-    if volume_type in ["io1", "io2"] and iops > size_gb * 3:
+    if volume_type in ("io1", "io2") and iops > size_gb * 3:
         extra_iops = iops - (size_gb * 3)
         iops_cost = extra_iops * 0.065
         base_cost += iops_cost
@@ -3,13 +3,67 @@ AWS Cost Optimization Opportunity Analysis
 Scans for unattached EBS volumes, unused Elastic IPs, and old snapshots.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from threading import Lock
 
 import boto3
+from botocore.config import Config
 
 from cost_toolkit.common.aws_common import get_all_aws_regions
 from cost_toolkit.common.cost_utils import calculate_ebs_volume_cost, calculate_snapshot_cost
 
+MAX_REGION_WORKERS = 32
+VOLUME_PAGE_SIZE = 500  # describe_volumes MaxResults ceiling
+SNAPSHOT_PAGE_SIZE = 1000  # describe_snapshots MaxResults ceiling
+ELASTIC_IP_MONTHLY_COST = 3.60  # $0.005/hour for an idle public IPv4 address
+OLD_SNAPSHOT_AGE_DAYS = 90
+EC2_MAX_ATTEMPTS = 10  # concurrent regional scans can trip EC2 request throttling
+
+_EC2_CLIENT_CONFIG = Config(
+    retries={"max_attempts": EC2_MAX_ATTEMPTS, "mode": "adaptive"},
+    max_pool_connections=MAX_REGION_WORKERS,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+)
+_SESSION_LOCK = Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_session():
+    """Create the shared boto3 session on first use rather than at import."""
+    return boto3.Session()
+
+
+@lru_cache(maxsize=None)
+def _get_ec2_client(region):
+    """Return the EC2 client for a region, reusing it across checks.
+
+    Clients come from one shared session so credential and endpoint resolution
+    happen once; sessions are not thread-safe, so creation is serialized.
+    """
+    with _SESSION_LOCK:
+        return _get_session().client("ec2", region_name=region, config=_EC2_CLIENT_CONFIG)
+
+
+def _scan_all_regions(scan_region, regions):
+    """Run a per-region scan concurrently and return results in region order.
+
+    Raises:
+        ClientError: If any regional scan fails
+    """
+    if not regions:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_REGION_WORKERS, len(regions))) as executor:
+        return list(executor.map(scan_region, regions))
+
+
+def _sum_region_totals(region_totals):
+    """Reduce per-region (count, cost) pairs to account-wide totals."""
+    return sum(count for count, _ in region_totals), sum(cost for _, cost in region_totals)
+
 
 def _scan_region_for_unattached_volumes(region):
     """Scan a single region for unattached EBS volumes.
@@ -17,38 +71,29 @@ def _scan_region_for_unattached_volumes(region):
     Raises:
         ClientError: If API call fails
     """
-    ec2 = boto3.client("ec2", region_name=region)
-    volumes = ec2.describe_volumes()["Volumes"]
+    ec2 = _get_ec2_client(region)
+    pages = ec2.get_paginator("describe_volumes").paginate(
+        Filters=[{"Name": "status", "Values": ["available"]}],
+        PaginationConfig={"PageSize": VOLUME_PAGE_SIZE},
+    )
 
     count = 0
     total_cost = 0.0
 
-    for volume in volumes:
-        attachments = []
-        if "Attachments" in volume:
-            attachments = volume["Attachments"]
-        if not attachments:
+    for page in pages:
+        for volume in page["Volumes"]:
             count += 1
-            size_gb = volume["Size"]
-            volume_type = volume["VolumeType"]
-            total_cost += calculate_ebs_volume_cost(size_gb, volume_type)
+            total_cost += calculate_ebs_volume_cost(volume["Size"], volume["VolumeType"])
     return count, total_cost
 
 
-def _check_unattached_ebs_volumes():
+def _check_unattached_ebs_volumes(regions):
     """Check for unattached EBS volumes across regions.
 
     Raises:
         ClientError: If API call fails
     """
-    regions = get_all_aws_regions()
-    unattached_volumes = 0
-    unattached_cost = 0.0
-
-    for region in regions:
-        count, cost = _scan_region_for_unattached_volumes(region)
-        unattached_volumes += count
-        unattached_cost += cost
+    unattached_volumes, unattached_cost = _sum_region_totals(_scan_all_regions(_scan_region_for_unattached_volumes, regions))
 
     if unattached_volumes > 0:
         return {
@@ -61,57 +106,75 @@ def _check_unattached_ebs_volumes():
     return None
 
 
-def _check_unused_elastic_ips():
-    """Check for unused Elastic IPs across regions.
+def _count_unused_elastic_ips(region):
+    """Count Elastic IPs in a single region that are not associated with an instance or ENI.
 
     Raises:
         ClientError: If API call fails
     """
-    elastic_ips = 0
-    regions = get_all_aws_regions()
-    for region in regions:
-        ec2 = boto3.client("ec2", region_name=region)
-        addresses = ec2.describe_addresses()["Addresses"]
+    ec2 = _get_ec2_client(region)
+    addresses = ec2.describe_addresses()["Addresses"]
+    return sum(1 for address in addresses if "AssociationId" not in address)
 
-        for address in addresses:
-            if "InstanceId" not in address:
-                elastic_ips += 1
+
+def _check_unused_elastic_ips(regions):
+    """Check for unused Elastic IPs across regions.
+
+    Raises:
+        ClientError: If API call fails
+    """
+    elastic_ips = sum(_scan_all_regions(_count_unused_elastic_ips, regions))
 
     if elastic_ips > 0:
         return {
             "category": "VPC Optimization",
             "description": f"{elastic_ips} unattached Elastic IPs",
-            "potential_savings": elastic_ips * 3.60,
+            "potential_savings": elastic_ips * ELASTIC_IP_MONTHLY_COST,
             "risk": "Low",
             "action": "Release unused Elastic IPs",
         }
     return None
 
 
-def _check_old_snapshots():
-    """Check for old snapshots across regions.
+def _scan_region_for_old_snapshots(cutoff_date, region):
+    """Scan a single region for snapshots started before cutoff_date.
+
+    StartTime values arrive as timezone-aware datetimes, so they compare
+    directly against the aware cutoff without per-snapshot conversion.
 
     Raises:
         ClientError: If API call fails
     """
-    old_snapshots = 0
-    snapshot_cost = 0.0
-    cutoff_date = datetime.now(tz=timezone.utc) - timedelta(days=90)
+    ec2 = _get_ec2_client(region)
+    pages = ec2.get_paginator("describe_snapshots").paginate(
+        OwnerIds=["self"],
+        PaginationConfig={"PageSize": SNAPSHOT_PAGE_SIZE},
+    )
 
-    for region in get_all_aws_regions():
-        ec2 = boto3.client("ec2", region_name=region)
-        snapshots = ec2.describe_snapshots(OwnerIds=["self"])["Snapshots"]
+    count = 0
+    total_size_gb = 0
 
-        for snapshot in snapshots:
+    for page in pages:
+        for snapshot in page["Snapshots"]:
             if snapshot["StartTime"] < cutoff_date:
-                old_snapshots += 1
-                size_gb = snapshot["VolumeSize"]
-                snapshot_cost += calculate_snapshot_cost(size_gb)
+                count += 1
+                total_size_gb += snapshot["VolumeSize"]
+    return count, calculate_snapshot_cost(total_size_gb)
+
+
+def _check_old_snapshots(regions):
+    """Check for old snapshots across regions.
+
+    Raises:
+        ClientError: If API call fails
+    """
+    cutoff_date = datetime.now(tz=timezone.utc) - timedelta(days=OLD_SNAPSHOT_AGE_DAYS)
+    old_snapshots, snapshot_cost = _sum_region_totals(_scan_all_regions(partial(_scan_region_for_old_snapshots, cutoff_date), regions))
 
     if old_snapshots > 0:
         return {
             "category": "Snapshot Optimization",
-            "description": f"{old_snapshots} snapshots older than 90 days",
+            "description": f"{old_snapshots} snapshots older than {OLD_SNAPSHOT_AGE_DAYS} days",
             "potential_savings": snapshot_cost,
             "risk": "Medium",
             "action": "Review and delete unnecessary old snapshots",
@@ -120,18 +183,22 @@ def _check_old_snapshots():
 
 
 def analyze_optimization_opportunities():
-    """Analyze potential cost optimization opportunities"""
-    opportunities = []
+    """Analyze potential cost optimization opportunities
 
+    Regions are looked up once and shared by every check.
+
+    Raises:
+        ClientError: If the region lookup or any check fails
+    """
+    regions = get_all_aws_regions()
     checkers = [
         _check_unattached_ebs_volumes,
         _check_unused_elastic_ips,
         _check_old_snapshots,
     ]
 
-    for checker in checkers:
-        opportunity = checker()
-        if opportunity:
-            opportunities.append(opportunity)
+    with ThreadPoolExecutor(max_workers=len(checkers)) as executor:
+        futures = [executor.submit(checker, regions) for checker in checkers]
+        opportunities = [future.result() for future in futures]
 
-    return opportunities
+    return [opportunity for opportunity in opportunities if opportunity]
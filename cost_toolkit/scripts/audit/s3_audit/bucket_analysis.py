@@ -13,6 +13,11 @@ from botocore.exceptions import ClientError
 from cost_toolkit.scripts import aws_s3_operations
 
 
+def _new_storage_class_totals():
+    """Per-storage-class counter for bucket_analysis["storage_classes"]."""
+    return {"count": 0, "size_bytes": 0}
+
+
 def get_bucket_location(bucket_name: str):
     """Expose bucket location resolver for reuse in utilities and tests."""
     return aws_s3_operations.get_bucket_location(bucket_name)
@@ -167,7 +172,7 @@ def analyze_bucket_objects(bucket_name, region):
             "region": region,
             "total_objects": 0,
             "total_size_bytes": 0,
-            "storage_classes": defaultdict(lambda: {"count": 0, "size_bytes": 0}),
+            "storage_classes": defaultdict(_new_storage_class_totals),
             "last_modified_oldest": None,
             "last_modified_newest": None,
             "large_objects": [],  # Objects > 100MB
@@ -23,6 +23,11 @@ from .reporting import (
 from .utils import calculate_monthly_cost
 
 
+def _new_storage_class_summary():
+    """Account-wide per-storage-class counter, including estimated cost."""
+    return {"count": 0, "size_bytes": 0, "cost": 0}
+
+
 def _process_single_bucket(bucket_name, bucket_region, storage_class_summary):
     """Process and display analysis for a single bucket"""
     print(f"📦 Analyzing bucket: {bucket_name} (region: {bucket_region})")
@@ -70,7 +75,7 @@ def _process_all_buckets(buckets):
     total_size_bytes = 0
     total_monthly_cost = 0
     all_bucket_analyses = []
-    storage_class_summary = defaultdict(lambda: {"count": 0, "size_bytes": 0, "cost": 0})
+    storage_class_summary = defaultdict(_new_storage_class_summary)
     all_recommendations = []
 
     for bucket in buckets:
@@ -2,12 +2,15 @@
 """Check EC2 instance status."""
 
 import base64
+import re
 
 import boto3
 from botocore.exceptions import ClientError
 
 from cost_toolkit.scripts import aws_utils
 
+_MIGRATION_KEYWORD_RE = re.compile("migration|mount|s3|sync|aws", re.IGNORECASE)
+
 
 def _print_instance_info(instance, instance_id):
     """Print instance status information."""
@@ -48,11 +51,7 @@ def _check_user_data(ec2, instance_id):
 
 def _print_migration_lines(lines):
     """Print migration-related console lines."""
-    migration_lines = []
-
-    for line in lines:
-        if any(keyword in line.lower() for keyword in ["migration", "mount", "s3", "sync", "aws"]):
-            migration_lines.append(line.strip())
+    migration_lines = [line.strip() for line in lines if _MIGRATION_KEYWORD_RE.search(line)]
 
     if migration_lines:
         print("🔍 Migration-related console output:")
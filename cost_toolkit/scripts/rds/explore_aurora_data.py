@@ -3,6 +3,7 @@
 
 import importlib
 import os
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Any
 
@@ -27,43 +28,45 @@ from cost_toolkit.scripts.rds.db_inspection_common import (
 
 # Constants
 MAX_SAMPLE_COLUMNS = 5
+AURORA_REQUIRED_ENV_VARS = ("AURORA_PORT", "AURORA_PASSWORD")
 
 
-def _require_env_var(name: str) -> str:  # pragma: no cover - trivial validation
-    """Return a required environment variable or raise."""
-    value = os.environ.get(name)
-    if value is None or not value.strip():
-        raise RuntimeError(f"{name} is required to explore the Aurora cluster")
-    return value.strip()
+def _require_env_vars(names: tuple[str, ...]) -> dict[str, str]:
+    """Return stripped values for required environment variables.
 
-
-def _parse_required_port(name: str, strict: bool = True) -> int:  # pragma: no cover
-    """Parse a required port environment variable."""
-    raw_value = _require_env_var(name)
-    try:
-        return int(raw_value)
-    except ValueError as exc:
-        if not strict and name == "AURORA_PORT":
-            return 5432
-        raise RuntimeError(f"{name} must be a valid integer, got {raw_value!r}") from exc
+    Every missing or blank name is reported together in one RuntimeError.
+    """
+    values = {name: os.environ.get(name, "").strip() for name in names}
+    missing = [name for name, value in values.items() if not value]
+    if missing:
+        verb = "is" if len(missing) == 1 else "are"
+        raise RuntimeError(f"{', '.join(missing)} {verb} required to explore the Aurora cluster")
+    return values
 
 
 def _load_aurora_settings():
-    """Load Aurora connection settings from environment variables."""
+    """Load Aurora connection settings from environment variables.
+
+    AURORA_HOST is checked first when a database or username is set; the
+    AURORA_REQUIRED_ENV_VARS are then validated in one pass and reported together.
+    """
     host = os.environ.get("AURORA_HOST")
     database = os.environ.get("AURORA_DATABASE")
     username = os.environ.get("AURORA_USERNAME")
     if host is None and (database or username):
         raise RuntimeError("AURORA_HOST is required to explore the Aurora cluster")
+    required = _require_env_vars(AURORA_REQUIRED_ENV_VARS)
     if host is None:
         host = "localhost"
     if database is None:
         database = "aurora"
     if username is None:
         username = "admin"
-    port = _parse_required_port("AURORA_PORT", strict=False)
-    password = _require_env_var("AURORA_PASSWORD")
-    return host, port, database, username, password
+    try:
+        port = int(required["AURORA_PORT"])
+    except ValueError:
+        port = 5432
+    return host, port, database, username, required["AURORA_PASSWORD"]
 
 
 def _import_psycopg2():
@@ -74,12 +77,12 @@ def _import_psycopg2():
         return None
 
 
+@lru_cache(maxsize=1)
 def _resolve_psycopg2() -> Any:
-    """Return a psycopg2-like module or None if unavailable."""
+    """Return a psycopg2-like module or None if unavailable; resolved once per process."""
     if PSYCOPG2_AVAILABLE and psycopg2 is not None:
         return psycopg2
     if not PSYCOPG2_AVAILABLE:
-        print("❌ psycopg2 module not found. Install with: pip install psycopg2-binary")
         return None
     module = _import_psycopg2()
     if module is None:
@@ -94,6 +97,7 @@ def explore_aurora_database():
     """Connect to the Aurora Serverless v2 cluster and explore user data"""
     psycopg2_local = _resolve_psycopg2()
     if psycopg2_local is None:
+        print("❌ psycopg2 module not found. Install with: pip install psycopg2-binary")
         return False
 
     try:
@@ -196,8 +196,8 @@ def run_smoke_test():
     smoke_tests.run_smoke_test(config, check_drive_available, create_migrator)
 
 
-def main():
-    """Main entry point for S3 migration"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the migrate_v2 command-line parser"""
     parser = argparse.ArgumentParser(
         description="S3 Bucket Migration Tool V2 - Optimized with AWS CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -213,7 +213,12 @@ def main():
         action="store_true",
         help="Run a local smoke test that simulates the backup workflow",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv=None):
+    """Main entry point for S3 migration"""
+    args = _build_parser().parse_args(argv)
     if args.test:
         run_smoke_test()
         return
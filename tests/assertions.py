@@ -7,3 +7,9 @@ def assert_equal(actual, expected, *, message: str | None = None) -> None:
     """Assert equality with a clearer error message."""
     failure_message = message or f"Expected {expected!r} but received {actual!r}"
     assert actual == expected, failure_message
+
+
+def assert_contains_all(text: str, *needles: str) -> None:
+    """Assert every needle occurs in text, reporting all that are missing at once."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"Missing {missing!r} from output:\n{text}"
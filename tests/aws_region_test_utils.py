@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 from botocore.exceptions import ClientError
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 REGION_LIST: Sequence[dict] = (
     {"RegionName": "us-east-1"},
     {"RegionName": "us-west-2"},
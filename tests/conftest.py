@@ -9,6 +9,7 @@ import pytest
 from botocore.exceptions import ClientError
 
 from cost_toolkit.common import aws_client_factory, credential_utils
+from cost_toolkit.overview import optimization
 from cost_toolkit.scripts.rds import explore_aurora_data, explore_user_data
 from tests.rds_audit_test_utils import (
     AURORA_MYSQL_CLUSTER,
@@ -75,6 +76,25 @@ def stub_boto3_client(monkeypatch):
     monkeypatch.setattr("boto3.client", fake_client)
 
 
+class _StubBotoSession:
+    """Minimal stub for boto3 sessions that hands out stub clients."""
+
+    def client(self, service_name: str, **kwargs):
+        return _StubBotoClient(service_name, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def stub_boto3_session(monkeypatch):
+    """Replace boto3.Session with a stub and clear the cached optimization session and clients."""
+    monkeypatch.setattr("boto3.Session", _StubBotoSession)
+    cached = (optimization._get_session, optimization._get_ec2_client)
+    for cached_factory in cached:
+        cached_factory.cache_clear()
+    yield
+    for cached_factory in cached:
+        cached_factory.cache_clear()
+
+
 @pytest.fixture(autouse=True)
 def stub_credentials(monkeypatch):
     """Provide fake AWS credentials so create_client doesn't fail."""
@@ -100,6 +120,14 @@ def stub_credentials(monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_psycopg2_resolution():
+    """Clear the cached psycopg2 lookup so per-test PSYCOPG2_AVAILABLE patches apply."""
+    explore_aurora_data._resolve_psycopg2.cache_clear()
+    yield
+    explore_aurora_data._resolve_psycopg2.cache_clear()
+
+
 @pytest.fixture
 def mock_aws_identity():
     """Mock AWS identity return value"""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+from contextlib import nullcontext
 from pathlib import Path
 from unittest import mock
 
@@ -168,12 +169,7 @@ def mock_db_connection():
     def _create_mock_connection(rows):
         mock_conn = mock.Mock()
         mock_conn.execute.return_value = rows
-
-        mock_cm = mock.MagicMock()
-        mock_cm.__enter__.return_value = mock_conn
-        mock_cm.__exit__.return_value = False
-
-        return mock_cm
+        return nullcontext(mock_conn)
 
     return _create_mock_connection
 
@@ -23,3 +23,12 @@ TEST_EFS_FILESYSTEM_COUNT = 2
 TEST_LAMBDA_CALL_COUNT = 2
 TEST_SECURITY_GROUP_COUNT = 2
 TEST_UNATTACHED_VOLUME_COUNT = 2
+
+# Migration verification test values: a fully verified 100-file bucket
+TEST_VERIFY_RESULTS = {
+    "verified_count": 100,
+    "size_verified": 100,
+    "checksum_verified": 100,
+    "total_bytes_verified": 1024000,
+    "local_file_count": 100,
+}
@@ -0,0 +1,59 @@
+"""Guard against redundant capsys.readouterr() drains in the test suite."""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+
+
+def _is_readouterr_call(node: ast.AST) -> bool:
+    """Return True for a capsys.readouterr() call."""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "readouterr"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "capsys"
+    )
+
+
+def _leaf_statements(func: ast.AST) -> list[ast.stmt]:
+    """Return non-compound statements in source order."""
+    leaves = [node for node in ast.walk(func) if isinstance(node, ast.stmt) and not hasattr(node, "body")]
+    return sorted(leaves, key=lambda stmt: (stmt.lineno, stmt.col_offset))
+
+
+def _redundant_drains(func: ast.AST) -> list[int]:
+    """Line numbers of readouterr() calls that follow another drain with only asserts in between."""
+    offending = []
+    drained_since_output = False
+    for stmt in _leaf_statements(func):
+        drain_count = sum(1 for node in ast.walk(stmt) if _is_readouterr_call(node))
+        if drain_count:
+            if drained_since_output or drain_count > 1:
+                offending.append(stmt.lineno)
+            drained_since_output = True
+        elif not isinstance(stmt, ast.Assert):
+            drained_since_output = False
+    return offending
+
+
+def _test_functions(tree: ast.AST):
+    """Yield the test function definitions in a parsed module."""
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test_"):
+            yield node
+
+
+def test_capsys_readouterr_called_once_per_output_phase():
+    """Each captured output phase should be drained once and bound to a local."""
+    violations = []
+    for path in sorted(TESTS_DIR.rglob("test_*.py")):
+        source = path.read_text(encoding="utf-8")
+        if "readouterr" not in source:
+            continue
+        for node in _test_functions(ast.parse(source)):
+            violations.extend(f"{path.name}:{lineno} ({node.name})" for lineno in _redundant_drains(node))
+    assert not violations, "Redundant capsys.readouterr() calls: " + ", ".join(violations)
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import base64
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
+import pytest
 from botocore.exceptions import ClientError
 
 from cost_toolkit.scripts.migration.aws_check_instance_status import (
@@ -16,6 +17,52 @@ from cost_toolkit.scripts.migration.aws_check_instance_status import (
     check_instance_status,
     main,
 )
+from tests.assertions import assert_contains_all
+
+_SVC_ERR_DESCRIBE_ATTR = ClientError({"Error": {"Code": "ServiceError"}}, "describe_instance_attribute")
+_SVC_ERR_CONSOLE = ClientError({"Error": {"Code": "ServiceError"}}, "get_console_output")
+_NOT_FOUND_ERR_INSTANCES = ClientError({"Error": {"Code": "InvalidInstanceID.NotFound"}}, "describe_instances")
+
+_RUNNING_INSTANCE_RESP = {
+    "Reservations": [
+        {
+            "Instances": [
+                {
+                    "State": {"Name": "running"},
+                    "InstanceType": "t2.micro",
+                    "LaunchTime": "2024-01-01",
+                    "Tags": [{"Key": "Name", "Value": "test"}],
+                }
+            ]
+        }
+    ]
+}
+
+_EXPECTED_INSTANCE_INFO = (
+    "INSTANCE STATUS",
+    "Instance ID: i-123456",
+    "State: running",
+    "Instance Type: t2.micro",
+)
+_EXPECTED_USER_DATA = (
+    "USER DATA STATUS",
+    "User Data is configured",
+    "Script size:",
+    "Migration script detected",
+)
+_EXPECTED_MIGRATION_LINES = (
+    "Migration-related console output",
+    "Mounting volumes",
+    "aws s3 sync completed",
+    "Migration successful",
+)
+_EXPECTED_TROUBLESHOOTING = (
+    "TROUBLESHOOTING",
+    "User Data may have failed",
+    "manual intervention",
+    "console output",
+    "SSM",
+)
 
 
 @patch("cost_toolkit.scripts.migration.aws_check_instance_status._print_troubleshooting")
@@ -33,7 +80,7 @@ def test_setup_credentials_calls_utils(
     _mock_troubleshooting,
 ):
     """check_instance_status should initialize AWS credentials before EC2 calls."""
-    mock_ec2 = MagicMock()
+    mock_ec2 = Mock()
     mock_ec2.describe_instances.return_value = {"Reservations": [{"Instances": [{"State": {"Name": "running"}}]}]}
     mock_boto_client.return_value = mock_ec2
 
@@ -57,10 +104,7 @@ class TestPrintInstanceInfo:
         _print_instance_info(instance, "i-123456")
 
         captured = capsys.readouterr()
-        assert "INSTANCE STATUS" in captured.out
-        assert "Instance ID: i-123456" in captured.out
-        assert "State: running" in captured.out
-        assert "Instance Type: t2.micro" in captured.out
+        assert_contains_all(captured.out, *_EXPECTED_INSTANCE_INFO)
 
     def test_print_instance_info_handles_missing_launch_time(self, capsys):
         """Test when launch time is not present."""
@@ -80,7 +124,7 @@ class TestCheckUserData:
 
     def test_check_user_data_exists(self, capsys):
         """Test checking instance with user data."""
-        mock_ec2 = MagicMock()
+        mock_ec2 = Mock()
         user_data_script = "#!/bin/bash\necho 'EBS to S3 Migration Script'\n"
         encoded = base64.b64encode(user_data_script.encode("utf-8")).decode("utf-8")
         mock_ec2.describe_instance_attribute.return_value = {"UserData": {"Value": encoded}}
@@ -88,14 +132,11 @@ class TestCheckUserData:
         _check_user_data(mock_ec2, "i-123")
 
         captured = capsys.readouterr()
-        assert "USER DATA STATUS" in captured.out
-        assert "User Data is configured" in captured.out
-        assert "Script size:" in captured.out
-        assert "Migration script detected" in captured.out
+        assert_contains_all(captured.out, *_EXPECTED_USER_DATA)
 
     def test_check_user_data_no_migration_script(self, capsys):
         """Test when user data exists but no migration script."""
-        mock_ec2 = MagicMock()
+        mock_ec2 = Mock()
         user_data = "#!/bin/bash\necho 'Hello World'\n"
         encoded = base64.b64encode(user_data.encode("utf-8")).decode("utf-8")
         mock_ec2.describe_instance_attribute.return_value = {"UserData": {"Value": encoded}}
@@ -107,7 +148,7 @@ class TestCheckUserData:
 
     def test_check_user_data_not_configured(self, capsys):
         """Test when no user data is configured."""
-        mock_ec2 = MagicMock()
+        mock_ec2 = Mock()
         mock_ec2.describe_instance_attribute.return_value = {}
 
         _check_user_data(mock_ec2, "i-123")
@@ -117,8 +158,8 @@ class TestCheckUserData:
 
     def test_check_user_data_handles_error(self, capsys):
         """Test error handling when retrieving user data."""
-        mock_ec2 = MagicMock()
-        mock_ec2.describe_instance_attribute.side_effect = ClientError({"Error": {"Code": "ServiceError"}}, "describe_instance_attribute")
+        mock_ec2 = Mock()
+        mock_ec2.describe_instance_attribute.side_effect = _SVC_ERR_DESCRIBE_ATTR
 
         _check_user_data(mock_ec2, "i-123")
 
@@ -142,10 +183,7 @@ class TestPrintMigrationLines:
         _print_migration_lines(lines)
 
         captured = capsys.readouterr()
-        assert "Migration-related console output" in captured.out
-        assert "Mounting volumes" in captured.out
-        assert "aws s3 sync completed" in captured.out
-        assert "Migration successful" in captured.out
+        assert_contains_all(captured.out, *_EXPECTED_MIGRATION_LINES)
 
     def test_print_migration_lines_no_matches(self, capsys):
         """Test when no migration keywords found."""
@@ -168,8 +206,19 @@ class TestPrintMigrationLines:
         _print_migration_lines(lines)
 
         captured = capsys.readouterr()
-        output_lines = [line for line in captured.out.split("\n") if "migration step" in line]
-        assert len(output_lines) <= 10
+        assert captured.out.count("migration step ") <= 10
+
+    @pytest.mark.parametrize("line_count", [100, 10_000])
+    def test_print_migration_lines_large_logs(self, capsys, line_count):
+        """Keyword filtering keeps only the tail of long console logs."""
+        lines = [f"AWS S3 SYNC chunk {i}" if i % 2 else f"kernel tick {i}" for i in range(line_count)]
+
+        _print_migration_lines(lines)
+
+        captured = capsys.readouterr()
+        assert captured.out.count("AWS S3 SYNC chunk ") == 10
+        assert f"AWS S3 SYNC chunk {line_count - 1}" in captured.out
+        assert "kernel tick" not in captured.out
 
     def test_print_migration_lines_case_insensitive(self, capsys):
         """Test keyword matching is case insensitive."""
@@ -191,7 +240,7 @@ class TestCheckSystemLogs:
 
     def test_check_logs_with_output(self, capsys):
         """Test checking system logs with console output."""
-        mock_ec2 = MagicMock()
+        mock_ec2 = Mock()
         console_output = "Booting system\nMounting volumes\nMigration started\n"
         mock_ec2.get_console_output.return_value = {"Output": console_output}
 
@@ -200,9 +249,22 @@ class TestCheckSystemLogs:
         captured = capsys.readouterr()
         assert "CHECKING SYSTEM LOGS" in captured.out
 
+    @pytest.mark.parametrize("repeat", [1, 100, 10_000])
+    def test_check_logs_scales_with_console_size(self, capsys, repeat):
+        """Large console logs still reduce to the last ten migration lines."""
+        mock_ec2 = Mock()
+        console_output = "Booting system\nMounting volumes\nkernel: noise\n" * repeat
+        mock_ec2.get_console_output.return_value = {"Output": console_output}
+
+        _check_system_logs(mock_ec2, "i-123")
+
+        captured = capsys.readouterr()
+        assert captured.out.count("Mounting volumes") == min(repeat, 10)
+        assert "kernel: noise" not in captured.out
+
     def test_check_logs_no_output(self, capsys):
         """Test when no console output available."""
-        mock_ec2 = MagicMock()
+        mock_ec2 = Mock()
         mock_ec2.get_console_output.return_value = {}
 
         _check_system_logs(mock_ec2, "i-123")
@@ -212,8 +274,8 @@ class TestCheckSystemLogs:
 
     def test_check_logs_handles_error(self, capsys):
         """Test error handling when retrieving console output."""
-        mock_ec2 = MagicMock()
-        mock_ec2.get_console_output.side_effect = ClientError({"Error": {"Code": "ServiceError"}}, "get_console_output")
+        mock_ec2 = Mock()
+        mock_ec2.get_console_output.side_effect = _SVC_ERR_CONSOLE
 
         _check_system_logs(mock_ec2, "i-123")
 
@@ -226,91 +288,65 @@ def test_print_troubleshooting_output(capsys):
     _print_troubleshooting()
 
     captured = capsys.readouterr()
-    assert "TROUBLESHOOTING" in captured.out
-    assert "User Data may have failed" in captured.out
-    assert "manual intervention" in captured.out
-    assert "console output" in captured.out
-    assert "SSM" in captured.out
+    assert_contains_all(captured.out, *_EXPECTED_TROUBLESHOOTING)
+
+
+@pytest.fixture
+def mock_boto_client():
+    """Patch boto3.client for the duration of a single check_instance_status test."""
+    with patch("boto3.client") as mock_client:
+        yield mock_client
+
+
+@pytest.fixture
+def running_ec2_mock():
+    """EC2 client mock describing one running instance with no user data or console output."""
+    mock_ec2 = Mock()
+    mock_ec2.describe_instances.return_value = _RUNNING_INSTANCE_RESP
+    mock_ec2.describe_instance_attribute.return_value = {}
+    mock_ec2.get_console_output.return_value = {}
+    return mock_ec2
 
 
 class TestCheckInstanceStatus:
     """Tests for check_instance_status function."""
 
-    def test_check_status_success(self, capsys):
+    def test_check_status_success(self, capsys, mock_boto_client, running_ec2_mock):
         """Test successful instance status check."""
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            mock_ec2.describe_instances.return_value = {
-                "Reservations": [
-                    {
-                        "Instances": [
-                            {
-                                "State": {"Name": "running"},
-                                "InstanceType": "t2.micro",
-                                "LaunchTime": "2024-01-01",
-                                "Tags": [{"Key": "Name", "Value": "test"}],
-                            }
-                        ]
-                    }
-                ]
-            }
-            mock_ec2.describe_instance_attribute.return_value = {}
-            mock_ec2.get_console_output.return_value = {}
-            mock_client.return_value = mock_ec2
-            check_instance_status()
+        mock_boto_client.return_value = running_ec2_mock
+        check_instance_status()
         captured = capsys.readouterr()
         assert "AWS Instance Status Check" in captured.out
 
-    def test_check_status_uses_correct_region(self):
+    def test_check_status_uses_correct_region(self, mock_boto_client, running_ec2_mock):
         """Test check uses correct AWS region."""
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            mock_ec2.describe_instances.return_value = {
-                "Reservations": [
-                    {
-                        "Instances": [
-                            {
-                                "State": {"Name": "running"},
-                                "InstanceType": "t2.micro",
-                                "Tags": [],
-                            }
-                        ]
-                    }
-                ]
-            }
-            mock_ec2.describe_instance_attribute.return_value = {}
-            mock_ec2.get_console_output.return_value = {}
-            mock_client.return_value = mock_ec2
-            check_instance_status()
-        mock_client.assert_called_once_with("ec2", region_name="eu-west-2")
+        mock_boto_client.return_value = running_ec2_mock
+        check_instance_status()
+        mock_boto_client.assert_called_once_with("ec2", region_name="eu-west-2")
 
 
 class TestCheckInstanceStatusErrors:
     """Error handling and helper function tests for check_instance_status."""
 
-    def test_check_status_handles_error(self, capsys):
+    def test_check_status_handles_error(self, capsys, mock_boto_client):
         """Test error handling during status check."""
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            mock_ec2.describe_instances.side_effect = ClientError({"Error": {"Code": "InvalidInstanceID.NotFound"}}, "describe_instances")
-            mock_client.return_value = mock_ec2
-            check_instance_status()
+        mock_ec2 = Mock()
+        mock_ec2.describe_instances.side_effect = _NOT_FOUND_ERR_INSTANCES
+        mock_boto_client.return_value = mock_ec2
+        check_instance_status()
         captured = capsys.readouterr()
         assert "Error checking instance status" in captured.out
 
-    def test_check_status_calls_all_checks(self):
+    def test_check_status_calls_all_checks(self, mock_boto_client, running_ec2_mock):
         """Test all check functions are called."""
-        with patch("boto3.client") as mock_client:
-            with (
-                patch("cost_toolkit.scripts.migration.aws_check_instance_status._print_instance_info") as mock_info,
-                patch("cost_toolkit.scripts.migration.aws_check_instance_status._check_user_data") as mock_user,
-                patch("cost_toolkit.scripts.migration.aws_check_instance_status._check_system_logs") as mock_logs,
-                patch("cost_toolkit.scripts.migration.aws_check_instance_status._print_troubleshooting") as mock_trouble,
-            ):
-                mock_ec2 = MagicMock()
-                mock_ec2.describe_instances.return_value = {"Reservations": [{"Instances": [{"State": {"Name": "running"}}]}]}
-                mock_client.return_value = mock_ec2
-                check_instance_status()
+        with (
+            patch("cost_toolkit.scripts.migration.aws_check_instance_status._print_instance_info") as mock_info,
+            patch("cost_toolkit.scripts.migration.aws_check_instance_status._check_user_data") as mock_user,
+            patch("cost_toolkit.scripts.migration.aws_check_instance_status._check_system_logs") as mock_logs,
+            patch("cost_toolkit.scripts.migration.aws_check_instance_status._print_troubleshooting") as mock_trouble,
+        ):
+            mock_boto_client.return_value = running_ec2_mock
+            check_instance_status()
         mock_info.assert_called_once()
         mock_user.assert_called_once()
         mock_logs.assert_called_once()
@@ -13,11 +13,34 @@ from cost_toolkit.overview.optimization import (
     _check_old_snapshots,
     _check_unattached_ebs_volumes,
     _check_unused_elastic_ips,
+    _get_ec2_client,
+    _get_session,
+    _scan_region_for_old_snapshots,
     _scan_region_for_unattached_volumes,
     analyze_optimization_opportunities,
 )
 from tests.conftest_test_values import TEST_UNATTACHED_VOLUME_COUNT
 
+OPTIMIZATION_MODULE = "cost_toolkit.overview.optimization"
+EC2_CLIENT_SPEC = ["describe_addresses", "get_paginator"]
+SINGLE_REGION = ["us-east-1"]
+
+
+@pytest.fixture
+def mock_ec2(monkeypatch):
+    """Route every regional EC2 client lookup to one shared MagicMock limited to the calls the scans make."""
+    client = MagicMock(spec=EC2_CLIENT_SPEC)
+    monkeypatch.setattr(f"{OPTIMIZATION_MODULE}._get_ec2_client", lambda _region: client)
+    return client
+
+
+@pytest.fixture
+def mock_regions(monkeypatch):
+    """Limit region discovery to us-east-1; tests may override return_value/side_effect."""
+    regions = MagicMock(return_value=SINGLE_REGION)
+    monkeypatch.setattr(f"{OPTIMIZATION_MODULE}.get_all_aws_regions", regions)
+    return regions
+
 
 def test_calculate_volume_cost_gp3():
     """Test calculate_ebs_volume_cost for gp3 volumes."""
@@ -37,259 +60,273 @@ def test_calculate_volume_cost_unknown_type():
     assert cost == 12.5  # 100 * 0.125 for io1
 
 
-def test_scan_region_for_unattached_volumes_with_volumes():
-    """Test _scan_region_for_unattached_volumes finds unattached volumes."""
-    with patch("boto3.client") as mock_client:
-        mock_ec2 = MagicMock()
-        mock_ec2.describe_volumes.return_value = {
-            "Volumes": [
-                {
-                    "VolumeId": "vol-1",
-                    "Size": 10,
-                    "VolumeType": "gp3",
-                    "Attachments": [],
-                },
-                {
-                    "VolumeId": "vol-2",
-                    "Size": 20,
-                    "VolumeType": "gp2",
-                    "Attachments": [],
-                },
-            ]
-        }
-        mock_client.return_value = mock_ec2
+def test_get_ec2_client_reuses_client_per_region():
+    """Test _get_ec2_client builds one client per region and reuses it."""
+    session = MagicMock()
+    mock_client = session.client
+    mock_client.side_effect = lambda *_args, **kwargs: MagicMock(name=kwargs["region_name"])
+    with patch(f"{OPTIMIZATION_MODULE}._get_session", return_value=session):
+        first = _get_ec2_client("us-east-1")
+        second = _get_ec2_client("us-east-1")
+        other = _get_ec2_client("us-west-2")
 
-        count, cost = _scan_region_for_unattached_volumes("us-east-1")
+    assert first is second
+    assert other is not first
+    assert mock_client.call_count == 2
+    client_config = mock_client.call_args.kwargs["config"]
+    assert (client_config.connect_timeout, client_config.read_timeout) == (5, 30)
+    assert client_config.retries == {"max_attempts": 10, "mode": "adaptive"}
 
-        assert count == TEST_UNATTACHED_VOLUME_COUNT
-        assert cost > 0
 
+def test_get_session_is_created_once_on_first_use():
+    """Test _get_session builds the shared boto3 session lazily and only once."""
+    with patch(f"{OPTIMIZATION_MODULE}.boto3.Session") as mock_session:
+        first = _get_session()
+        second = _get_session()
+
+    assert first is second
+    mock_session.assert_called_once_with()
+
+
+def test_scan_region_for_unattached_volumes_with_volumes(mock_ec2):
+    """Test _scan_region_for_unattached_volumes counts every available volume across pages."""
+    mock_ec2.get_paginator.return_value.paginate.return_value = [
+        {"Volumes": [{"VolumeId": "vol-1", "Size": 10, "VolumeType": "gp3", "Attachments": []}]},
+        {"Volumes": [{"VolumeId": "vol-2", "Size": 20, "VolumeType": "gp2", "Attachments": []}]},
+    ]
+
+    count, cost = _scan_region_for_unattached_volumes("us-east-1")
+
+    assert count == TEST_UNATTACHED_VOLUME_COUNT
+    assert cost == pytest.approx(2.8)  # 10 * 0.08 + 20 * 0.10
+    mock_ec2.get_paginator.assert_called_once_with("describe_volumes")
 
-def test_scan_region_for_unattached_volumes_all_attached():
-    """Test _scan_region_for_unattached_volumes when all volumes are attached."""
-    with patch("boto3.client") as mock_client:
-        mock_ec2 = MagicMock()
-        mock_ec2.describe_volumes.return_value = {
-            "Volumes": [
-                {
-                    "VolumeId": "vol-1",
-                    "Size": 10,
-                    "VolumeType": "gp3",
-                    "Attachments": [{"InstanceId": "i-123"}],
-                }
-            ]
-        }
-        mock_client.return_value = mock_ec2
 
-        count, cost = _scan_region_for_unattached_volumes("us-east-1")
+def test_scan_region_for_unattached_volumes_filters_server_side(mock_ec2):
+    """Test _scan_region_for_unattached_volumes asks EC2 for available volumes only."""
+    mock_ec2.get_paginator.return_value.paginate.return_value = [{"Volumes": []}]
 
-        assert count == 0
-        assert cost == 0.0
+    count, cost = _scan_region_for_unattached_volumes("us-east-1")
 
+    assert count == 0
+    assert cost == 0.0
+    mock_ec2.get_paginator.return_value.paginate.assert_called_once_with(
+        Filters=[{"Name": "status", "Values": ["available"]}],
+        PaginationConfig={"PageSize": 500},
+    )
 
-def test_scan_region_for_unattached_volumes_error():
+
+def test_scan_region_for_unattached_volumes_error(mock_ec2):
     """Test _scan_region_for_unattached_volumes raises errors."""
-    with patch("boto3.client") as mock_client:
-        mock_ec2 = MagicMock()
-        mock_ec2.describe_volumes.side_effect = ClientError({"Error": {"Code": "TestError"}}, "test")
-        mock_client.return_value = mock_ec2
+    mock_ec2.get_paginator.return_value.paginate.side_effect = ClientError({"Error": {"Code": "TestError"}}, "DescribeVolumes")
 
-        with pytest.raises(ClientError):
-            _scan_region_for_unattached_volumes("us-east-1")
+    with pytest.raises(ClientError):
+        _scan_region_for_unattached_volumes("us-east-1")
 
 
 def test_check_unattached_ebs_volumes_with_volumes():
     """Test _check_unattached_ebs_volumes returns recommendation."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions") as mock_regions:
-        with patch("cost_toolkit.overview.optimization._scan_region_for_unattached_volumes") as mock_scan:
-            mock_regions.return_value = ["us-east-1"]
-            mock_scan.return_value = (5, 50.0)
+    with patch(f"{OPTIMIZATION_MODULE}._scan_region_for_unattached_volumes", return_value=(5, 50.0)):
+        result = _check_unattached_ebs_volumes(SINGLE_REGION)
 
-            result = _check_unattached_ebs_volumes()
-
-            assert result is not None
-            assert result["category"] == "EBS Optimization"
-            assert result["potential_savings"] == 50.0
+    assert result is not None
+    assert result["category"] == "EBS Optimization"
+    assert result["potential_savings"] == 50.0
 
 
 def test_check_unattached_ebs_volumes_none_found():
     """Test _check_unattached_ebs_volumes when no unattached volumes exist."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions") as mock_regions:
-        with patch("cost_toolkit.overview.optimization._scan_region_for_unattached_volumes") as mock_scan:
-            mock_regions.return_value = ["us-east-1"]
-            mock_scan.return_value = (0, 0.0)
+    with patch(f"{OPTIMIZATION_MODULE}._scan_region_for_unattached_volumes", return_value=(0, 0.0)):
+        result = _check_unattached_ebs_volumes(SINGLE_REGION)
+
+    assert result is None
+
+
+def test_check_unattached_ebs_volumes_aggregates_regions():
+    """Test _check_unattached_ebs_volumes sums results from every region."""
+    regional_results = {"us-east-1": (2, 20.0), "us-west-2": (3, 30.0), "eu-west-1": (0, 0.0)}
+    with patch(f"{OPTIMIZATION_MODULE}._scan_region_for_unattached_volumes", side_effect=regional_results.__getitem__):
+        result = _check_unattached_ebs_volumes(list(regional_results))
+
+    assert result is not None
+    assert result["description"] == "5 unattached EBS volumes"
+    assert result["potential_savings"] == 50.0
 
-            result = _check_unattached_ebs_volumes()
 
-            assert result is None
+def test_check_unattached_ebs_volumes_regional_worker_error():
+    """Test a ClientError raised in any regional worker propagates to the caller."""
 
+    def _scan(region):
+        if region == "us-west-2":
+            raise ClientError({"Error": {"Code": "TestError"}}, "DescribeVolumes")
+        return 1, 10.0
 
-def test_check_unused_elastic_ips_with_unused():
+    with patch(f"{OPTIMIZATION_MODULE}._scan_region_for_unattached_volumes", side_effect=_scan):
+        with pytest.raises(ClientError):
+            _check_unattached_ebs_volumes(["us-east-1", "us-west-2"])
+
+
+def test_check_unattached_ebs_volumes_no_regions():
+    """Test _check_unattached_ebs_volumes returns None when no regions are available."""
+    assert _check_unattached_ebs_volumes([]) is None
+
+
+def test_check_unused_elastic_ips_with_unused(mock_ec2):
     """Test _check_unused_elastic_ips finds unused IPs."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions", return_value=["us-east-1"]):
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            mock_ec2.describe_addresses.return_value = {
-                "Addresses": [
-                    {"PublicIp": "1.2.3.4"},  # No InstanceId
-                    {"PublicIp": "5.6.7.8", "InstanceId": "i-123"},  # Attached
-                ]
-            }
-            mock_client.return_value = mock_ec2
+    mock_ec2.describe_addresses.return_value = {
+        "Addresses": [
+            {"PublicIp": "1.2.3.4"},  # No AssociationId
+            {"PublicIp": "5.6.7.8", "InstanceId": "i-123", "AssociationId": "eipassoc-1"},  # Attached
+            {"PublicIp": "9.9.9.9", "AssociationId": "eipassoc-2", "NetworkInterfaceId": "eni-1"},  # ENI-only
+        ]
+    }
 
-            result = _check_unused_elastic_ips()
+    result = _check_unused_elastic_ips(SINGLE_REGION)
 
-            assert result is not None
-            assert result["category"] == "VPC Optimization"
-            assert "Elastic IPs" in result["description"]
+    assert result is not None
+    assert result["category"] == "VPC Optimization"
+    assert result["description"] == "1 unattached Elastic IPs"
 
 
-def test_check_unused_elastic_ips_all_used():
+def test_check_unused_elastic_ips_all_used(mock_ec2):
     """Test _check_unused_elastic_ips when all IPs are in use."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions", return_value=["us-east-1"]):
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            mock_ec2.describe_addresses.return_value = {
-                "Addresses": [
-                    {"PublicIp": "1.2.3.4", "InstanceId": "i-123"},
-                    {"PublicIp": "5.6.7.8", "InstanceId": "i-456"},
-                ]
-            }
-            mock_client.return_value = mock_ec2
+    mock_ec2.describe_addresses.return_value = {
+        "Addresses": [
+            {"PublicIp": "1.2.3.4", "InstanceId": "i-123", "AssociationId": "eipassoc-1"},
+            {"PublicIp": "5.6.7.8", "InstanceId": "i-456", "AssociationId": "eipassoc-2"},
+        ]
+    }
 
-            result = _check_unused_elastic_ips()
+    result = _check_unused_elastic_ips(SINGLE_REGION)
 
-            assert result is None
+    assert result is None
 
 
-def test_check_unused_elastic_ips_error():
+def test_check_unused_elastic_ips_error(mock_ec2):
     """Test _check_unused_elastic_ips raises errors."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions", return_value=["us-east-1"]):
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            mock_ec2.describe_addresses.side_effect = ClientError({"Error": {"Code": "TestError"}}, "test")
-            mock_client.return_value = mock_ec2
+    mock_ec2.describe_addresses.side_effect = ClientError({"Error": {"Code": "TestError"}}, "DescribeAddresses")
 
-            with pytest.raises(ClientError):
-                _check_unused_elastic_ips()
+    with pytest.raises(ClientError):
+        _check_unused_elastic_ips(SINGLE_REGION)
 
 
-def test_check_unattached_ebs_volumes_client_error():
-    """Test _check_unattached_ebs_volumes raises ClientError."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions") as mock_regions:
-        mock_regions.side_effect = ClientError({"Error": {"Code": "TestError"}}, "test")
+def test_check_unused_elastic_ips_regional_error(mock_ec2):
+    """Test _check_unused_elastic_ips raises on first regional error."""
+    mock_ec2.describe_addresses.side_effect = [
+        ClientError({"Error": {"Code": "TestError"}}, "DescribeAddresses"),
+        {"Addresses": []},
+    ]
 
-        with pytest.raises(ClientError):
-            _check_unattached_ebs_volumes()
+    with pytest.raises(ClientError):
+        _check_unused_elastic_ips(["us-east-1", "us-west-2"])
 
 
-def test_check_unused_elastic_ips_regional_error():
-    """Test _check_unused_elastic_ips raises on first regional error."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions", return_value=["us-east-1"]):
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            # First region fails
-            mock_ec2.describe_addresses.side_effect = ClientError({"Error": {"Code": "TestError"}}, "test")
-            mock_client.return_value = mock_ec2
+def test_check_old_snapshots_with_old_snapshots(mock_ec2):
+    """Test _check_old_snapshots finds old snapshots."""
+    now = datetime.now(tz=timezone.utc)
+    old_date = now - timedelta(days=100)
+    recent_date = now - timedelta(days=10)
+    mock_ec2.get_paginator.return_value.paginate.return_value = [
+        {
+            "Snapshots": [
+                {"SnapshotId": "snap-1", "StartTime": old_date, "VolumeSize": 100},
+                {"SnapshotId": "snap-2", "StartTime": recent_date, "VolumeSize": 50},
+                {"SnapshotId": "snap-3", "StartTime": old_date, "VolumeSize": 200},
+            ]
+        }
+    ]
 
-            with pytest.raises(ClientError):
-                _check_unused_elastic_ips()
+    result = _check_old_snapshots(SINGLE_REGION)
 
+    assert result is not None
+    assert result["category"] == "Snapshot Optimization"
+    assert result["risk"] == "Medium"
+    assert result["description"] == "2 snapshots older than 90 days"
+    assert result["potential_savings"] == pytest.approx(15.0)  # 300 GB * 0.05
 
-def test_check_old_snapshots_with_old_snapshots():
-    """Test _check_old_snapshots finds old snapshots."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions") as mock_regions:
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            old_date = datetime.now(tz=timezone.utc) - timedelta(days=100)
-            recent_date = datetime.now(tz=timezone.utc) - timedelta(days=10)
-
-            mock_ec2.describe_snapshots.return_value = {
-                "Snapshots": [
-                    {"SnapshotId": "snap-1", "StartTime": old_date, "VolumeSize": 100},
-                    {"SnapshotId": "snap-2", "StartTime": recent_date, "VolumeSize": 50},
-                    {"SnapshotId": "snap-3", "StartTime": old_date, "VolumeSize": 200},
-                ]
-            }
-            mock_client.return_value = mock_ec2
-            mock_regions.return_value = ["us-east-1"]
-
-            result = _check_old_snapshots()
-
-            assert result is not None
-            assert result["category"] == "Snapshot Optimization"
-            assert result["risk"] == "Medium"
-            assert "90 days" in result["description"]
-
-
-def test_check_old_snapshots_no_old_snapshots():
+
+def test_check_old_snapshots_no_old_snapshots(mock_ec2):
     """Test _check_old_snapshots when no old snapshots exist."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions") as mock_regions:
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            recent_date = datetime.now(tz=timezone.utc) - timedelta(days=10)
+    recent_date = datetime.now(tz=timezone.utc) - timedelta(days=10)
+    mock_ec2.get_paginator.return_value.paginate.return_value = [
+        {"Snapshots": [{"SnapshotId": "snap-1", "StartTime": recent_date, "VolumeSize": 100}]}
+    ]
+
+    result = _check_old_snapshots(SINGLE_REGION)
 
-            mock_ec2.describe_snapshots.return_value = {
-                "Snapshots": [
-                    {"SnapshotId": "snap-1", "StartTime": recent_date, "VolumeSize": 100},
-                ]
-            }
-            mock_client.return_value = mock_ec2
-            mock_regions.return_value = ["us-east-1"]
+    assert result is None
+
+
+def test_scan_region_for_old_snapshots_streams_pages(mock_ec2):
+    """Test _scan_region_for_old_snapshots reduces a lazily yielded page stream."""
+    cutoff = datetime.now(tz=timezone.utc) - timedelta(days=90)
+    old_date = cutoff - timedelta(days=1)
+    mock_ec2.get_paginator.return_value.paginate.return_value = (
+        {"Snapshots": [{"SnapshotId": f"snap-{page}", "StartTime": old_date, "VolumeSize": 10}]} for page in range(3)
+    )
+
+    count, cost = _scan_region_for_old_snapshots(cutoff, "us-east-1")
+
+    assert count == 3
+    assert cost == pytest.approx(1.5)  # 30 GB * 0.05
+
+
+def test_scan_region_for_old_snapshots_compares_across_timezones(mock_ec2):
+    """Test _scan_region_for_old_snapshots compares aware StartTimes regardless of their tzinfo."""
+    cutoff = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    eastern = timezone(timedelta(hours=-5))
+    mock_ec2.get_paginator.return_value.paginate.return_value = [
+        {
+            "Snapshots": [
+                {"SnapshotId": "snap-old", "StartTime": datetime(2023, 12, 31, 18, 59, tzinfo=eastern), "VolumeSize": 10},
+                {"SnapshotId": "snap-new", "StartTime": datetime(2023, 12, 31, 19, 1, tzinfo=eastern), "VolumeSize": 20},
+            ]
+        }
+    ]
 
-            result = _check_old_snapshots()
+    count, cost = _scan_region_for_old_snapshots(cutoff, "us-east-1")
 
-            assert result is None
+    assert count == 1
+    assert cost == pytest.approx(0.5)  # 10 GB * 0.05
 
 
-def test_check_old_snapshots_regional_error():
+def test_check_old_snapshots_regional_error(mock_ec2):
     """Test _check_old_snapshots raises on regional errors."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions") as mock_regions:
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            mock_ec2.describe_snapshots.side_effect = ClientError({"Error": {"Code": "TestError"}}, "test")
-            mock_client.return_value = mock_ec2
-            mock_regions.return_value = ["us-east-1"]
+    mock_ec2.get_paginator.return_value.paginate.side_effect = ClientError({"Error": {"Code": "TestError"}}, "DescribeSnapshots")
 
-            with pytest.raises(ClientError):
-                _check_old_snapshots()
+    with pytest.raises(ClientError):
+        _check_old_snapshots(SINGLE_REGION)
 
 
-def test_check_old_snapshots_client_error():
-    """Test _check_old_snapshots raises on top-level ClientError."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions") as mock_regions:
-        mock_regions.side_effect = ClientError({"Error": {"Code": "TestError"}}, "test")
+def test_check_old_snapshots_computes_cutoff_once():
+    """Test _check_old_snapshots hands every regional scan the same precomputed cutoff."""
+    with patch(f"{OPTIMIZATION_MODULE}._scan_region_for_old_snapshots", return_value=(0, 0.0)) as mock_scan:
+        _check_old_snapshots(["us-east-1", "us-west-2", "eu-west-1"])
 
-        with pytest.raises(ClientError):
-            _check_old_snapshots()
+    cutoffs = {call.args[0] for call in mock_scan.call_args_list}
+    assert mock_scan.call_count == 3
+    assert len(cutoffs) == 1
+    assert datetime.now(tz=timezone.utc) - cutoffs.pop() >= timedelta(days=90)
 
 
-def test_check_old_snapshots_single_old_snapshot():
+def test_check_old_snapshots_single_old_snapshot(mock_ec2):
     """Test _check_old_snapshots detects a single old snapshot."""
-    with patch("cost_toolkit.overview.optimization.get_all_aws_regions") as mock_regions:
-        with patch("boto3.client") as mock_client:
-            mock_ec2 = MagicMock()
-            old_date = datetime.now(tz=timezone.utc) - timedelta(days=100)
+    old_date = datetime.now(tz=timezone.utc) - timedelta(days=100)
+    mock_ec2.get_paginator.return_value.paginate.return_value = [
+        {"Snapshots": [{"SnapshotId": "snap-1", "StartTime": old_date, "VolumeSize": 100}]}
+    ]
 
-            mock_ec2.describe_snapshots.return_value = {
-                "Snapshots": [
-                    {"SnapshotId": "snap-1", "StartTime": old_date, "VolumeSize": 100},
-                ]
-            }
-            mock_client.return_value = mock_ec2
-            mock_regions.return_value = ["us-east-1"]
+    result = _check_old_snapshots(SINGLE_REGION)
 
-            result = _check_old_snapshots()
+    assert result is not None
+    assert result["category"] == "Snapshot Optimization"
 
-            assert result is not None
-            assert result["category"] == "Snapshot Optimization"
 
-
-def test_analyze_optimization_opportunities_all_checks():
+def test_analyze_optimization_opportunities_all_checks(mock_regions):
     """Test analyze_optimization_opportunities with all opportunities."""
-    with patch("cost_toolkit.overview.optimization._check_unattached_ebs_volumes") as mock_ebs:
-        with patch("cost_toolkit.overview.optimization._check_unused_elastic_ips") as mock_eip:
-            with patch("cost_toolkit.overview.optimization._check_old_snapshots") as mock_snapshots:
+    with patch(f"{OPTIMIZATION_MODULE}._check_unattached_ebs_volumes") as mock_ebs:
+        with patch(f"{OPTIMIZATION_MODULE}._check_unused_elastic_ips") as mock_eip:
+            with patch(f"{OPTIMIZATION_MODULE}._check_old_snapshots") as mock_snapshots:
                 mock_ebs.return_value = {
                     "category": "EBS Optimization",
                     "description": "Test EBS",
@@ -320,11 +357,11 @@ def test_analyze_optimization_opportunities_all_checks():
                 assert result[2]["category"] == "Snapshot Optimization"
 
 
-def test_analyze_optimization_opportunities_partial_checks():
+def test_analyze_optimization_opportunities_partial_checks(mock_regions):
     """Test analyze_optimization_opportunities with some None results."""
-    with patch("cost_toolkit.overview.optimization._check_unattached_ebs_volumes") as mock_ebs:
-        with patch("cost_toolkit.overview.optimization._check_unused_elastic_ips") as mock_eip:
-            with patch("cost_toolkit.overview.optimization._check_old_snapshots") as mock_snapshots:
+    with patch(f"{OPTIMIZATION_MODULE}._check_unattached_ebs_volumes") as mock_ebs:
+        with patch(f"{OPTIMIZATION_MODULE}._check_unused_elastic_ips") as mock_eip:
+            with patch(f"{OPTIMIZATION_MODULE}._check_old_snapshots") as mock_snapshots:
                 mock_ebs.return_value = {
                     "category": "EBS Optimization",
                     "description": "Test EBS",
@@ -341,11 +378,11 @@ def test_analyze_optimization_opportunities_partial_checks():
                 assert result[0]["category"] == "EBS Optimization"
 
 
-def test_analyze_optimization_opportunities_no_opportunities():
+def test_analyze_optimization_opportunities_no_opportunities(mock_regions):
     """Test analyze_optimization_opportunities with no opportunities."""
-    with patch("cost_toolkit.overview.optimization._check_unattached_ebs_volumes") as mock_ebs:
-        with patch("cost_toolkit.overview.optimization._check_unused_elastic_ips") as mock_eip:
-            with patch("cost_toolkit.overview.optimization._check_old_snapshots") as mock_snapshots:
+    with patch(f"{OPTIMIZATION_MODULE}._check_unattached_ebs_volumes") as mock_ebs:
+        with patch(f"{OPTIMIZATION_MODULE}._check_unused_elastic_ips") as mock_eip:
+            with patch(f"{OPTIMIZATION_MODULE}._check_old_snapshots") as mock_snapshots:
                 mock_ebs.return_value = None
                 mock_eip.return_value = None
                 mock_snapshots.return_value = None
@@ -354,3 +391,50 @@ def test_analyze_optimization_opportunities_no_opportunities():
 
                 assert len(result) == 0
                 assert not result
+
+
+def test_analyze_optimization_opportunities_propagates_check_error(mock_regions):
+    """Test analyze_optimization_opportunities re-raises a failing check's ClientError."""
+    with patch(f"{OPTIMIZATION_MODULE}._check_unattached_ebs_volumes", return_value=None):
+        with patch(
+            f"{OPTIMIZATION_MODULE}._check_unused_elastic_ips",
+            side_effect=ClientError({"Error": {"Code": "TestError"}}, "DescribeAddresses"),
+        ):
+            with patch(f"{OPTIMIZATION_MODULE}._check_old_snapshots", return_value=None):
+                with pytest.raises(ClientError):
+                    analyze_optimization_opportunities()
+
+
+def test_analyze_optimization_opportunities_shares_one_region_list(mock_regions):
+    """Test analyze_optimization_opportunities looks regions up once and hands the list to every check."""
+    with (
+        patch(f"{OPTIMIZATION_MODULE}._check_unattached_ebs_volumes", return_value=None) as mock_ebs,
+        patch(f"{OPTIMIZATION_MODULE}._check_unused_elastic_ips", return_value=None) as mock_eip,
+        patch(f"{OPTIMIZATION_MODULE}._check_old_snapshots", return_value=None) as mock_snapshots,
+    ):
+        analyze_optimization_opportunities()
+
+    mock_regions.assert_called_once_with()
+    for mock_check in (mock_ebs, mock_eip, mock_snapshots):
+        mock_check.assert_called_once_with(SINGLE_REGION)
+
+
+def test_analyze_optimization_opportunities_describes_regions_once(monkeypatch, mock_ec2):
+    """Test the concurrent checks trigger a single describe_regions call between them."""
+    monkeypatch.delenv("COST_TOOLKIT_STATIC_AWS_REGIONS", raising=False)
+    region_client = MagicMock()
+    region_client.describe_regions.return_value = {"Regions": [{"RegionName": "us-east-1"}, {"RegionName": "us-west-2"}]}
+    monkeypatch.setattr("cost_toolkit.common.aws_common.create_ec2_client", lambda **_kwargs: region_client)
+    mock_ec2.describe_addresses.return_value = {"Addresses": []}
+    mock_ec2.get_paginator.return_value.paginate.side_effect = lambda **_kwargs: iter([{"Volumes": [], "Snapshots": []}])
+
+    assert analyze_optimization_opportunities() == []
+    assert region_client.describe_regions.call_count == 1
+
+
+def test_analyze_optimization_opportunities_region_lookup_error(mock_regions):
+    """Test analyze_optimization_opportunities raises when the region lookup fails."""
+    mock_regions.side_effect = ClientError({"Error": {"Code": "TestError"}}, "DescribeRegions")
+
+    with pytest.raises(ClientError):
+        analyze_optimization_opportunities()
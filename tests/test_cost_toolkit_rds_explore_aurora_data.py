@@ -8,18 +8,23 @@ from unittest.mock import patch
 import pytest
 
 from cost_toolkit.scripts.rds import explore_aurora_data
-from tests.conftest_rds_shared import (
-    TestConstantsShared,
-    TestParseRequiredPortShared,
-    TestRequireEnvVarShared,
-)
+from tests.conftest_rds_shared import TestConstantsShared
 
 EXPLORE_MODULE = "cost_toolkit.scripts.rds.explore_aurora_data"
+INSPECTION_HELPER_PATCHES = dict.fromkeys(
+    (
+        "print_database_version_info",
+        "list_databases",
+        "list_schemas",
+        "list_views",
+        "get_database_size",
+        "list_functions",
+    ),
+    mock.DEFAULT,
+)
 
 # Re-export shared test classes for aurora data module
 TestConstants = TestConstantsShared
-TestRequireEnvVar = TestRequireEnvVarShared
-TestParseRequiredPort = TestParseRequiredPortShared
 
 
 class TestExploreAuroraDatabase:
@@ -84,6 +89,36 @@ class TestLoadAuroraSettings:
             with pytest.raises(RuntimeError, match="AURORA_HOST is required"):
                 explore_aurora_data._load_aurora_settings()  # pylint: disable=protected-access
 
+    def test_load_aurora_settings_missing_password(self):
+        """Test loading Aurora settings without a password."""
+        with patch.dict("os.environ", {"AURORA_PORT": "5432", "AURORA_PASSWORD": "  "}, clear=True):
+            with pytest.raises(RuntimeError, match="^AURORA_PASSWORD is required"):
+                explore_aurora_data._load_aurora_settings()  # pylint: disable=protected-access
+
+    def test_load_aurora_settings_reports_all_missing(self):
+        """Test every missing required variable is reported in one error."""
+        with patch.dict("os.environ", {}, clear=True):
+            with pytest.raises(RuntimeError, match="AURORA_PORT, AURORA_PASSWORD are required"):
+                explore_aurora_data._load_aurora_settings()  # pylint: disable=protected-access
+
+
+class TestRequireEnvVars:
+    """Tests for _require_env_vars function."""
+
+    def test_require_env_vars_returns_stripped_values(self):
+        """Test every requested variable comes back stripped."""
+        with patch.dict("os.environ", {"AURORA_PORT": " 6543 ", "AURORA_PASSWORD": " secret "}, clear=True):
+            values = explore_aurora_data._require_env_vars(("AURORA_PORT", "AURORA_PASSWORD"))  # pylint: disable=protected-access
+
+        assert values == {"AURORA_PORT": "6543", "AURORA_PASSWORD": "secret"}
+
+    def test_load_aurora_settings_uses_checked_port(self):
+        """Test the port comes from the validated values rather than a second environment read."""
+        with patch.dict("os.environ", {"AURORA_PORT": " 6543 ", "AURORA_PASSWORD": "secret"}, clear=True):
+            _host, port, _database, _username, password = explore_aurora_data._load_aurora_settings()  # pylint: disable=protected-access
+
+        assert (port, password) == (6543, "secret")
+
 
 class TestExploreAuroraReturnValues:
     """Tests for explore_aurora_database return values."""
@@ -139,15 +174,13 @@ class TestExploreWithSuccessfulConnection:
         mock_resolve.return_value = mock_psycopg2
         mock_load.return_value = ("localhost", 5432, "testdb", "admin", "password")
 
-        with patch(f"{EXPLORE_MODULE}.print_database_version_info"):
-            with patch(f"{EXPLORE_MODULE}.list_databases"):
-                with patch(f"{EXPLORE_MODULE}.list_schemas"):
-                    with patch(f"{EXPLORE_MODULE}.list_tables", return_value=[]):
-                        with patch(f"{EXPLORE_MODULE}.list_views"):
-                            with patch(f"{EXPLORE_MODULE}.analyze_tables", return_value=0):
-                                with patch(f"{EXPLORE_MODULE}.get_database_size"):
-                                    with patch(f"{EXPLORE_MODULE}.list_functions"):
-                                        result = explore_aurora_data.explore_aurora_database()
+        with patch.multiple(
+            EXPLORE_MODULE,
+            list_tables=mock.Mock(return_value=[]),
+            analyze_tables=mock.Mock(return_value=0),
+            **INSPECTION_HELPER_PATCHES,
+        ):
+            result = explore_aurora_data.explore_aurora_database()
 
         assert result is True
         mock_connection.close.assert_called_once()
@@ -191,15 +224,13 @@ class TestExploreEmptyDatabase:
         mock_resolve.return_value = mock_psycopg2
         mock_load.return_value = ("localhost", 5432, "testdb", "admin", "password")
 
-        with patch(f"{EXPLORE_MODULE}.print_database_version_info"):
-            with patch(f"{EXPLORE_MODULE}.list_databases"):
-                with patch(f"{EXPLORE_MODULE}.list_schemas"):
-                    with patch(f"{EXPLORE_MODULE}.list_tables", return_value=[]):
-                        with patch(f"{EXPLORE_MODULE}.list_views"):
-                            with patch(f"{EXPLORE_MODULE}.analyze_tables", return_value=0):
-                                with patch(f"{EXPLORE_MODULE}.get_database_size"):
-                                    with patch(f"{EXPLORE_MODULE}.list_functions"):
-                                        result = explore_aurora_data.explore_aurora_database()
+        with patch.multiple(
+            EXPLORE_MODULE,
+            list_tables=mock.Mock(return_value=[]),
+            analyze_tables=mock.Mock(return_value=0),
+            **INSPECTION_HELPER_PATCHES,
+        ):
+            result = explore_aurora_data.explore_aurora_database()
 
         assert result is True
         captured = capsys.readouterr()
@@ -222,15 +253,13 @@ class TestExploreWithData:
         mock_resolve.return_value = mock_psycopg2
         mock_load.return_value = ("localhost", 5432, "testdb", "admin", "password")
 
-        with patch(f"{EXPLORE_MODULE}.print_database_version_info"):
-            with patch(f"{EXPLORE_MODULE}.list_databases"):
-                with patch(f"{EXPLORE_MODULE}.list_schemas"):
-                    with patch(f"{EXPLORE_MODULE}.list_tables", return_value=[{"name": "test_table"}]):
-                        with patch(f"{EXPLORE_MODULE}.list_views"):
-                            with patch(f"{EXPLORE_MODULE}.analyze_tables", return_value=100):
-                                with patch(f"{EXPLORE_MODULE}.get_database_size"):
-                                    with patch(f"{EXPLORE_MODULE}.list_functions"):
-                                        result = explore_aurora_data.explore_aurora_database()
+        with patch.multiple(
+            EXPLORE_MODULE,
+            list_tables=mock.Mock(return_value=[{"name": "test_table"}]),
+            analyze_tables=mock.Mock(return_value=100),
+            **INSPECTION_HELPER_PATCHES,
+        ):
+            result = explore_aurora_data.explore_aurora_database()
 
         assert result is True
         captured = capsys.readouterr()
@@ -7,18 +7,31 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from cost_toolkit.scripts.rds import explore_user_data
-from tests.conftest_rds_shared import (
-    TestConstantsShared,
-    TestParseRequiredPortShared,
-    TestRequireEnvVarShared,
-)
+from tests import conftest_rds_shared
+from tests.conftest_rds_shared import TestConstantsShared
 
 EXPLORE_USER_MODULE = explore_user_data
 
 # Re-export shared test classes for user data module
 TestConstants = TestConstantsShared
-TestRequireEnvVar = TestRequireEnvVarShared
-TestParseRequiredPort = TestParseRequiredPortShared
+
+
+class TestRequireEnvVar(conftest_rds_shared.TestRequireEnvVarShared):
+    """_require_env_var tests; explore_aurora_data validates its variables with _require_env_vars instead."""
+
+    @pytest.fixture
+    def rds_module(self):
+        """Run the shared tests against explore_user_data only."""
+        return explore_user_data
+
+
+class TestParseRequiredPort(conftest_rds_shared.TestParseRequiredPortShared):
+    """_parse_required_port tests; explore_aurora_data parses AURORA_PORT from its checked values instead."""
+
+    @pytest.fixture
+    def rds_module(self):
+        """Run the shared tests against explore_user_data only."""
+        return explore_user_data
 
 
 class TestSplitRequiredList:
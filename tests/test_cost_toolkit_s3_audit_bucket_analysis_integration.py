@@ -13,6 +13,10 @@ from botocore.exceptions import ClientError
 from cost_toolkit.scripts.audit.s3_audit.bucket_analysis import analyze_bucket_objects
 from tests.assertions import assert_equal
 
+AUG_2024 = datetime(2024, 8, 1, tzinfo=timezone.utc)
+SEP_2024 = datetime(2024, 9, 1, tzinfo=timezone.utc)
+OCT_2024 = datetime(2024, 10, 1, tzinfo=timezone.utc)
+
 
 def test_analyze_bucket_objects_success():
     """Test analyze_bucket_objects successfully analyzes a bucket."""
@@ -49,13 +53,13 @@ def test_analyze_bucket_objects_success():
                         "Key": "file1.txt",
                         "Size": 1024,
                         "StorageClass": "STANDARD",
-                        "LastModified": datetime(2024, 10, 1, tzinfo=timezone.utc),
+                        "LastModified": OCT_2024,
                     },
                     {
                         "Key": "file2.txt",
                         "Size": 2048,
                         "StorageClass": "GLACIER",
-                        "LastModified": datetime(2024, 9, 1, tzinfo=timezone.utc),
+                        "LastModified": SEP_2024,
                     },
                 ]
             }
@@ -198,8 +202,9 @@ def test_analyze_bucket_objects_with_large_and_old_objects():
         )
 
         large_size = 200 * 1024 * 1024  # 200MB
-        old_date = datetime.now(timezone.utc) - timedelta(days=200)
-        recent_date = datetime.now(timezone.utc) - timedelta(days=10)  # Recent, not old
+        now = datetime.now(timezone.utc)
+        old_date = now - timedelta(days=200)
+        recent_date = now - timedelta(days=10)  # Recent, not old
 
         # Mock paginator
         mock_paginator = MagicMock()
@@ -262,7 +267,7 @@ def test_analyze_bucket_objects_multiple_pages():
                         "Key": "file1.txt",
                         "Size": 1000,
                         "StorageClass": "STANDARD",
-                        "LastModified": datetime(2024, 10, 1, tzinfo=timezone.utc),
+                        "LastModified": OCT_2024,
                     }
                 ]
             },
@@ -272,7 +277,7 @@ def test_analyze_bucket_objects_multiple_pages():
                         "Key": "file2.txt",
                         "Size": 2000,
                         "StorageClass": "GLACIER",
-                        "LastModified": datetime(2024, 9, 1, tzinfo=timezone.utc),
+                        "LastModified": SEP_2024,
                     }
                 ]
             },
@@ -282,7 +287,7 @@ def test_analyze_bucket_objects_multiple_pages():
                         "Key": "file3.txt",
                         "Size": 3000,
                         "StorageClass": "STANDARD_IA",
-                        "LastModified": datetime(2024, 8, 1, tzinfo=timezone.utc),
+                        "LastModified": AUG_2024,
                     }
                 ]
             },
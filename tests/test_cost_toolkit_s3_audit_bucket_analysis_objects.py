@@ -7,226 +7,131 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-
-from cost_toolkit.scripts.audit.s3_audit.bucket_analysis import _process_object
-from tests.assertions import assert_equal
-
-
-def test_process_object_standard_storage():
-    """Test _process_object handles standard storage class objects."""
-    bucket_analysis = {
+from types import MappingProxyType
+
+import pytest
+
+from cost_toolkit.scripts.audit.s3_audit.bucket_analysis import (
+    _new_storage_class_totals,
+    _process_object,
+)
+
+LARGE_OBJECT_THRESHOLD = 100 * 1024 * 1024  # 100MB, matching analyze_bucket_objects
+JAN_2024 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+JUN_2024 = datetime(2024, 6, 1, tzinfo=timezone.utc)
+OCT_2024 = datetime(2024, 10, 1, tzinfo=timezone.utc)
+NOV_2024 = datetime(2024, 11, 1, tzinfo=timezone.utc)
+LARGE_SIZE = 200 * 1024 * 1024  # 200MB
+_EMPTY_BUCKET_TOTALS = MappingProxyType(
+    {
         "total_objects": 0,
         "total_size_bytes": 0,
-        "storage_classes": defaultdict(lambda: {"count": 0, "size_bytes": 0}),
         "last_modified_oldest": None,
         "last_modified_newest": None,
-        "large_objects": [],
-        "old_objects": [],
     }
+)
 
-    obj = {
-        "Key": "test-key.txt",
-        "Size": 1024,
-        "StorageClass": "STANDARD",
-        "LastModified": datetime(2024, 1, 1, tzinfo=timezone.utc),
-    }
 
-    ninety_days_ago = datetime.now(timezone.utc) - timedelta(days=90)
-    large_object_threshold = 100 * 1024 * 1024
+def _s3_object(key, size, storage_class, last_modified):
+    """Build a list_objects_v2 Contents entry."""
+    return {"Key": key, "Size": size, "StorageClass": storage_class, "LastModified": last_modified}
 
-    _process_object(obj, bucket_analysis, ninety_days_ago, large_object_threshold)
 
-    assert_equal(bucket_analysis["total_objects"], 1)
-    assert_equal(bucket_analysis["total_size_bytes"], 1024)
-    assert_equal(bucket_analysis["storage_classes"]["STANDARD"]["count"], 1)
-    assert_equal(bucket_analysis["storage_classes"]["STANDARD"]["size_bytes"], 1024)
-    assert_equal(bucket_analysis["last_modified_oldest"], datetime(2024, 1, 1, tzinfo=timezone.utc))
-    assert_equal(bucket_analysis["last_modified_newest"], datetime(2024, 1, 1, tzinfo=timezone.utc))
+def _process_objects(objects, bucket_analysis, ninety_days_ago):
+    """Feed each object through _process_object in listing order."""
+    for obj in objects:
+        _process_object(obj, bucket_analysis, ninety_days_ago, LARGE_OBJECT_THRESHOLD)
 
 
-def test_process_object_no_storage_class_defaults_to_standard():
-    """Test _process_object defaults to STANDARD when StorageClass is missing."""
-    bucket_analysis = {
-        "total_objects": 0,
-        "total_size_bytes": 0,
-        "storage_classes": defaultdict(lambda: {"count": 0, "size_bytes": 0}),
-        "last_modified_oldest": None,
-        "last_modified_newest": None,
+@pytest.fixture
+def bucket_analysis():
+    """Empty per-bucket accumulator in the shape analyze_bucket_objects builds."""
+    return {
+        **_EMPTY_BUCKET_TOTALS,
+        "storage_classes": defaultdict(_new_storage_class_totals),
         "large_objects": [],
         "old_objects": [],
     }
 
-    obj = {
-        "Key": "test-key.txt",
-        "Size": 2048,
-        "LastModified": datetime(2024, 6, 1, tzinfo=timezone.utc),
-        "StorageClass": "STANDARD",
-    }
-
-    ninety_days_ago = datetime.now(timezone.utc) - timedelta(days=90)
-    large_object_threshold = 100 * 1024 * 1024
-
-    _process_object(obj, bucket_analysis, ninety_days_ago, large_object_threshold)
-
-    assert_equal(bucket_analysis["storage_classes"]["STANDARD"]["count"], 1)
-    assert_equal(bucket_analysis["storage_classes"]["STANDARD"]["size_bytes"], 2048)
 
-
-def test_process_object_large_object():
-    """Test _process_object identifies large objects."""
-    bucket_analysis = {
-        "total_objects": 0,
-        "total_size_bytes": 0,
-        "storage_classes": defaultdict(lambda: {"count": 0, "size_bytes": 0}),
-        "last_modified_oldest": None,
-        "last_modified_newest": None,
-        "large_objects": [],
-        "old_objects": [],
-    }
-
-    large_size = 200 * 1024 * 1024  # 200MB
-    obj = {
-        "Key": "large-file.bin",
-        "Size": large_size,
-        "StorageClass": "STANDARD",
-        "LastModified": datetime(2024, 10, 1, tzinfo=timezone.utc),
-    }
-
-    ninety_days_ago = datetime.now(timezone.utc) - timedelta(days=90)
-    large_object_threshold = 100 * 1024 * 1024
-
-    _process_object(obj, bucket_analysis, ninety_days_ago, large_object_threshold)
-
-    assert_equal(len(bucket_analysis["large_objects"]), 1)
-    large_obj = bucket_analysis["large_objects"][0]
-    assert_equal(large_obj["key"], "large-file.bin")
-    assert_equal(large_obj["size_bytes"], large_size)
-    assert_equal(large_obj["storage_class"], "STANDARD")
-
-
-def test_process_object_old_object():
+@pytest.fixture(scope="session")
+def ninety_days_ago():
+    """Old-object cutoff matching analyze_bucket_objects, computed once per session."""
+    return datetime.now(timezone.utc) - timedelta(days=90)
+
+
+@pytest.fixture
+def old_date():
+    """LastModified timestamp 200 days before the test runs."""
+    return datetime.now(timezone.utc) - timedelta(days=200)
+
+
+PROCESS_OBJECT_CASES = (
+    (
+        (_s3_object("test-key.txt", 1024, "STANDARD", JAN_2024),),
+        {
+            "total_objects": 1,
+            "total_size_bytes": 1024,
+            "storage_classes": {"STANDARD": {"count": 1, "size_bytes": 1024}},
+            "last_modified_oldest": JAN_2024,
+            "last_modified_newest": JAN_2024,
+        },
+    ),
+    (
+        (_s3_object("large-file.bin", LARGE_SIZE, "STANDARD", OCT_2024),),
+        {
+            "large_objects": [
+                {"key": "large-file.bin", "size_bytes": LARGE_SIZE, "storage_class": "STANDARD", "last_modified": OCT_2024},
+            ],
+        },
+    ),
+    (
+        (
+            _s3_object("middle.txt", 1000, "STANDARD", JUN_2024),
+            _s3_object("oldest.txt", 1000, "STANDARD", JAN_2024),
+            _s3_object("newest.txt", 1000, "STANDARD", NOV_2024),
+        ),
+        {"last_modified_oldest": JAN_2024, "last_modified_newest": NOV_2024, "total_objects": 3},
+    ),
+    (
+        (
+            _s3_object("standard.txt", 1000, "STANDARD", JUN_2024),
+            _s3_object("glacier.txt", 2000, "GLACIER", JUN_2024),
+            _s3_object("ia.txt", 3000, "STANDARD_IA", JUN_2024),
+        ),
+        {
+            "storage_classes": {
+                "STANDARD": {"count": 1, "size_bytes": 1000},
+                "GLACIER": {"count": 1, "size_bytes": 2000},
+                "STANDARD_IA": {"count": 1, "size_bytes": 3000},
+            },
+            "total_size_bytes": 6000,
+        },
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "objects,expected",
+    PROCESS_OBJECT_CASES,
+    ids=["standard_storage", "large_object", "oldest_and_newest", "multiple_storage_classes"],
+)
+def test_process_object_accumulates(bucket_analysis, ninety_days_ago, objects, expected):
+    """Test _process_object folds each object into the bucket totals."""
+    _process_objects(objects, bucket_analysis, ninety_days_ago)
+
+    for field, value in expected.items():
+        assert bucket_analysis[field] == value, field
+
+
+def test_process_object_old_object(bucket_analysis, ninety_days_ago, old_date):
     """Test _process_object identifies old objects."""
-    bucket_analysis = {
-        "total_objects": 0,
-        "total_size_bytes": 0,
-        "storage_classes": defaultdict(lambda: {"count": 0, "size_bytes": 0}),
-        "last_modified_oldest": None,
-        "last_modified_newest": None,
-        "large_objects": [],
-        "old_objects": [],
-    }
-
-    old_date = datetime.now(timezone.utc) - timedelta(days=200)
-    obj = {
-        "Key": "old-file.txt",
-        "Size": 5000,
-        "StorageClass": "STANDARD",
-        "LastModified": old_date,
-    }
-
-    ninety_days_ago = datetime.now(timezone.utc) - timedelta(days=90)
-    large_object_threshold = 100 * 1024 * 1024
-
-    _process_object(obj, bucket_analysis, ninety_days_ago, large_object_threshold)
+    _process_objects((_s3_object("old-file.txt", 5000, "STANDARD", old_date),), bucket_analysis, ninety_days_ago)
 
-    assert_equal(len(bucket_analysis["old_objects"]), 1)
+    assert len(bucket_analysis["old_objects"]) == 1
     old_obj = bucket_analysis["old_objects"][0]
-    assert_equal(old_obj["key"], "old-file.txt")
-    assert_equal(old_obj["size_bytes"], 5000)
-    assert_equal(old_obj["storage_class"], "STANDARD")
+    assert old_obj["key"] == "old-file.txt"
+    assert old_obj["size_bytes"] == 5000
+    assert old_obj["storage_class"] == "STANDARD"
     # Age should be approximately 200 days (allow small variance for test execution time)
     assert old_obj["age_days"] >= 199 and old_obj["age_days"] <= 201
-
-
-def test_process_object_updates_oldest_and_newest():
-    """Test _process_object tracks oldest and newest objects."""
-    bucket_analysis = {
-        "total_objects": 0,
-        "total_size_bytes": 0,
-        "storage_classes": defaultdict(lambda: {"count": 0, "size_bytes": 0}),
-        "last_modified_oldest": None,
-        "last_modified_newest": None,
-        "large_objects": [],
-        "old_objects": [],
-    }
-
-    ninety_days_ago = datetime.now(timezone.utc) - timedelta(days=90)
-    large_object_threshold = 100 * 1024 * 1024
-
-    # First object
-    obj1 = {
-        "Key": "middle.txt",
-        "Size": 1000,
-        "StorageClass": "STANDARD",
-        "LastModified": datetime(2024, 6, 1, tzinfo=timezone.utc),
-    }
-    _process_object(obj1, bucket_analysis, ninety_days_ago, large_object_threshold)
-
-    # Older object
-    obj2 = {
-        "Key": "oldest.txt",
-        "Size": 1000,
-        "StorageClass": "STANDARD",
-        "LastModified": datetime(2024, 1, 1, tzinfo=timezone.utc),
-    }
-    _process_object(obj2, bucket_analysis, ninety_days_ago, large_object_threshold)
-
-    # Newer object
-    obj3 = {
-        "Key": "newest.txt",
-        "Size": 1000,
-        "StorageClass": "STANDARD",
-        "LastModified": datetime(2024, 11, 1, tzinfo=timezone.utc),
-    }
-    _process_object(obj3, bucket_analysis, ninety_days_ago, large_object_threshold)
-
-    assert_equal(bucket_analysis["last_modified_oldest"], datetime(2024, 1, 1, tzinfo=timezone.utc))
-    assert_equal(bucket_analysis["last_modified_newest"], datetime(2024, 11, 1, tzinfo=timezone.utc))
-    assert_equal(bucket_analysis["total_objects"], 3)
-
-
-def test_process_object_multiple_storage_classes():
-    """Test _process_object handles multiple storage classes."""
-    bucket_analysis = {
-        "total_objects": 0,
-        "total_size_bytes": 0,
-        "storage_classes": defaultdict(lambda: {"count": 0, "size_bytes": 0}),
-        "last_modified_oldest": None,
-        "last_modified_newest": None,
-        "large_objects": [],
-        "old_objects": [],
-    }
-
-    ninety_days_ago = datetime.now(timezone.utc) - timedelta(days=90)
-    large_object_threshold = 100 * 1024 * 1024
-
-    obj1 = {
-        "Key": "standard.txt",
-        "Size": 1000,
-        "StorageClass": "STANDARD",
-        "LastModified": datetime(2024, 6, 1, tzinfo=timezone.utc),
-    }
-    obj2 = {
-        "Key": "glacier.txt",
-        "Size": 2000,
-        "StorageClass": "GLACIER",
-        "LastModified": datetime(2024, 6, 1, tzinfo=timezone.utc),
-    }
-    obj3 = {
-        "Key": "ia.txt",
-        "Size": 3000,
-        "StorageClass": "STANDARD_IA",
-        "LastModified": datetime(2024, 6, 1, tzinfo=timezone.utc),
-    }
-
-    _process_object(obj1, bucket_analysis, ninety_days_ago, large_object_threshold)
-    _process_object(obj2, bucket_analysis, ninety_days_ago, large_object_threshold)
-    _process_object(obj3, bucket_analysis, ninety_days_ago, large_object_threshold)
-
-    assert_equal(bucket_analysis["storage_classes"]["STANDARD"]["count"], 1)
-    assert_equal(bucket_analysis["storage_classes"]["STANDARD"]["size_bytes"], 1000)
-    assert_equal(bucket_analysis["storage_classes"]["GLACIER"]["count"], 1)
-    assert_equal(bucket_analysis["storage_classes"]["GLACIER"]["size_bytes"], 2000)
-    assert_equal(bucket_analysis["storage_classes"]["STANDARD_IA"]["count"], 1)
-    assert_equal(bucket_analysis["storage_classes"]["STANDARD_IA"]["size_bytes"], 3000)
-    assert_equal(bucket_analysis["total_size_bytes"], 6000)
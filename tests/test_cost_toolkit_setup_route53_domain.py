@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import socket
 from unittest.mock import MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError
 
+from cost_toolkit.scripts.setup import aws_route53_domain_setup as route53_setup_module
 from cost_toolkit.scripts.setup.aws_route53_domain_setup import (
     create_missing_dns_records,
     get_current_hosted_zone_nameservers,
@@ -301,16 +303,29 @@ class TestCreateMissingDnsRecords:
             create_missing_dns_records("example.com", "Z123456789ABC", "192.168.1.1")
 
 
+@pytest.fixture
+def resolve_hosts(monkeypatch):
+    """Install per-host getaddrinfo answers: a list of addresses, or an exception to raise."""
+
+    def _install(answers):
+        def _getaddrinfo(host, _port, proto):
+            assert proto == socket.IPPROTO_TCP
+            answer = answers[host]
+            if isinstance(answer, Exception):
+                raise answer
+            return [(None, None, None, None, (address, 0)) for address in answer]
+
+        monkeypatch.setattr(route53_setup_module.socket, "getaddrinfo", _getaddrinfo)
+
+    return _install
+
+
 class TestTestDnsResolution:
     """Tests for test_dns_resolution function."""
 
-    @patch("cost_toolkit.scripts.setup.aws_route53_domain_setup.socket.getaddrinfo")
-    def test_dns_resolution_both_succeed(self, mock_getaddrinfo, capsys):
+    def test_dns_resolution_both_succeed(self, resolve_hosts, capsys):
         """Test DNS resolution when both root and www resolve."""
-        mock_getaddrinfo.side_effect = [
-            [(None, None, None, None, ("192.168.1.1", 0))],
-            [(None, None, None, None, ("192.168.1.2", 0))],
-        ]
+        resolve_hosts({"example.com": ["192.168.1.1"], "www.example.com": ["192.168.1.2"]})
 
         verify_dns_resolution("example.com")
 
@@ -318,26 +333,18 @@ class TestTestDnsResolution:
         assert "example.com resolves to: 192.168.1.1" in captured.out
         assert "www.example.com resolves to: 192.168.1.2" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.aws_route53_domain_setup.socket.getaddrinfo")
-    def test_dns_resolution_root_fails(self, mock_getaddrinfo, capsys):
+    def test_dns_resolution_root_fails(self, resolve_hosts, capsys):
         """Test DNS resolution when root domain fails."""
-        mock_getaddrinfo.side_effect = [
-            [],
-            [(None, None, None, None, ("192.168.1.2", 0))],
-        ]
+        resolve_hosts({"example.com": [], "www.example.com": ["192.168.1.2"]})
 
         verify_dns_resolution("example.com")
 
         captured = capsys.readouterr()
         assert "example.com does not resolve" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.aws_route53_domain_setup.socket.getaddrinfo")
-    def test_dns_resolution_www_fails(self, mock_getaddrinfo, capsys):
+    def test_dns_resolution_www_fails(self, resolve_hosts, capsys):
         """Test DNS resolution when www subdomain fails."""
-        mock_getaddrinfo.side_effect = [
-            [(None, None, None, None, ("192.168.1.1", 0))],
-            [],
-        ]
+        resolve_hosts({"example.com": ["192.168.1.1"], "www.example.com": []})
 
         verify_dns_resolution("example.com")
 
@@ -345,13 +352,9 @@ class TestTestDnsResolution:
         assert "example.com resolves to: 192.168.1.1" in captured.out
         assert "www.example.com does not resolve" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.aws_route53_domain_setup.socket.getaddrinfo")
-    def test_dns_resolution_socket_error(self, mock_getaddrinfo, capsys):
+    def test_dns_resolution_socket_error(self, resolve_hosts, capsys):
         """Test DNS resolution with socket error."""
-        mock_getaddrinfo.side_effect = [
-            OSError("lookup failed"),
-            [(None, None, None, None, ("192.168.1.2", 0))],
-        ]
+        resolve_hosts({"example.com": OSError("lookup failed"), "www.example.com": ["192.168.1.2"]})
 
         verify_dns_resolution("example.com")
 
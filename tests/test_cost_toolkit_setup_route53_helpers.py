@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from cost_toolkit.scripts.setup.exceptions import (
@@ -21,41 +19,69 @@ from cost_toolkit.scripts.setup.route53_helpers import (
     _print_dns_status,
 )
 
+DOMAIN = "example.com"
+EXAMPLE_ZONE_ID = "/hostedzone/Z123"
+
+# The helpers only read their input, so these canonical zones and records are shared across tests.
+EXAMPLE_ZONE = {"Name": f"{DOMAIN}.", "Id": EXAMPLE_ZONE_ID}
+OTHER_ZONE = {"Name": "other.com.", "Id": "/hostedzone/Z456"}
+EXAMPLE_NS_RECORD = {
+    "Type": "NS",
+    "Name": "example.com.",
+    "ResourceRecords": ({"Value": "ns-1.awsdns-01.com"}, {"Value": "ns-2.awsdns-02.net"}),
+}
+ROOT_A_RECORD = {"Type": "A", "Name": "example.com.", "ResourceRecords": ({"Value": "192.168.1.1"},)}
+WWW_A_RECORD = {"Type": "A", "Name": "www.example.com.", "ResourceRecords": ({"Value": "192.168.1.2"},)}
+CANVA_TXT_RECORD = {
+    "Type": "TXT",
+    "Name": "_canva-domain-verify.example.com.",
+    "ResourceRecords": ({"Value": "canva-verification-code"},),
+}
+
+
+class _FakeRoute53:
+    def __init__(self, hosted_zones=(), record_sets=()):
+        """Create fake Route53 client serving fixed zones and record sets."""
+        self._hosted_zones = list(hosted_zones)
+        self._record_sets = list(record_sets)
+        self.requested_zone_ids = []
+
+    def list_hosted_zones(self):
+        """Return the configured hosted zones."""
+        return {"HostedZones": self._hosted_zones}
+
+    def list_resource_record_sets(self, HostedZoneId):  # pylint: disable=invalid-name  # noqa: N803 - boto3 casing
+        """Return the configured record sets and remember the requested zone."""
+        self.requested_zone_ids.append(HostedZoneId)
+        return {"ResourceRecordSets": self._record_sets}
+
 
 class TestFindHostedZone:
     """Tests for _find_hosted_zone function."""
 
     def test_find_existing_zone(self):
         """Test finding an existing hosted zone."""
-        mock_route53 = MagicMock()
-        mock_route53.list_hosted_zones.return_value = {
-            "HostedZones": [
-                {"Name": "example.com.", "Id": "/hostedzone/Z123"},
-                {"Name": "other.com.", "Id": "/hostedzone/Z456"},
-            ]
-        }
+        route53 = _FakeRoute53(hosted_zones=[EXAMPLE_ZONE, OTHER_ZONE])
 
-        result = _find_hosted_zone(mock_route53, "example.com")
+        result = _find_hosted_zone(route53, DOMAIN)
 
-        assert result == {"Name": "example.com.", "Id": "/hostedzone/Z123"}
+        assert result == EXAMPLE_ZONE
 
     def test_find_zone_not_found(self):
         """Test when hosted zone is not found."""
-        mock_route53 = MagicMock()
-        mock_route53.list_hosted_zones.return_value = {"HostedZones": [{"Name": "other.com.", "Id": "/hostedzone/Z456"}]}
+        route53 = _FakeRoute53(hosted_zones=[OTHER_ZONE])
 
         with pytest.raises(HostedZoneNotFoundError) as exc_info:
-            _find_hosted_zone(mock_route53, "example.com")
+            _find_hosted_zone(route53, DOMAIN)
 
-        assert "example.com" in str(exc_info.value)
+        assert DOMAIN in str(exc_info.value)
 
     def test_find_zone_empty_list(self):
         """Test with empty hosted zones list."""
-        mock_route53 = MagicMock()
-        mock_route53.list_hosted_zones.return_value = {"HostedZones": []}
+        route53 = _FakeRoute53()
 
         with pytest.raises(HostedZoneNotFoundError):
-            _find_hosted_zone(mock_route53, "example.com")
+            _find_hosted_zone(route53, DOMAIN)
 
 
 class TestGetNameserverRecords:
@@ -63,238 +89,124 @@ class TestGetNameserverRecords:
 
     def test_get_nameservers_success(self):
         """Test successfully getting nameserver records."""
-        mock_route53 = MagicMock()
-        mock_route53.list_resource_record_sets.return_value = {
-            "ResourceRecordSets": [
-                {
-                    "Type": "NS",
-                    "Name": "example.com.",
-                    "ResourceRecords": [
-                        {"Value": "ns-1.awsdns-01.com"},
-                        {"Value": "ns-2.awsdns-02.net"},
-                    ],
-                }
-            ]
-        }
-
-        result = _get_nameserver_records(mock_route53, "/hostedzone/Z123", "example.com")
+        route53 = _FakeRoute53(record_sets=[ROOT_A_RECORD, EXAMPLE_NS_RECORD])
+
+        result = _get_nameserver_records(route53, EXAMPLE_ZONE_ID, DOMAIN)
 
         assert result == ["ns-1.awsdns-01.com", "ns-2.awsdns-02.net"]
+        assert route53.requested_zone_ids == [EXAMPLE_ZONE_ID]
 
     def test_get_nameservers_not_found(self):
         """Test when nameserver records not found."""
-        mock_route53 = MagicMock()
-        mock_route53.list_resource_record_sets.return_value = {"ResourceRecordSets": [{"Type": "A", "Name": "example.com."}]}
+        route53 = _FakeRoute53(record_sets=[ROOT_A_RECORD])
 
         with pytest.raises(NSRecordsNotFoundError) as exc_info:
-            _get_nameserver_records(mock_route53, "/hostedzone/Z123", "example.com")
+            _get_nameserver_records(route53, EXAMPLE_ZONE_ID, DOMAIN)
 
-        assert "example.com" in str(exc_info.value)
+        assert DOMAIN in str(exc_info.value)
 
     def test_get_nameservers_wrong_domain(self):
         """Test when NS record exists but for different domain."""
-        mock_route53 = MagicMock()
-        mock_route53.list_resource_record_sets.return_value = {
-            "ResourceRecordSets": [
-                {
-                    "Type": "NS",
-                    "Name": "other.com.",
-                    "ResourceRecords": [{"Value": "ns-1.awsdns-01.com"}],
-                }
-            ]
-        }
+        route53 = _FakeRoute53(record_sets=[{**EXAMPLE_NS_RECORD, "Name": "other.com."}])
 
         with pytest.raises(NSRecordsNotFoundError):
-            _get_nameserver_records(mock_route53, "/hostedzone/Z123", "example.com")
+            _get_nameserver_records(route53, EXAMPLE_ZONE_ID, DOMAIN)
 
 
 class TestCheckRootARecord:
     """Tests for _check_root_a_record function."""
 
-    def test_root_a_record_found(self, capsys):
-        """Test finding root domain A record."""
-        record = {
-            "Type": "A",
-            "Name": "example.com.",
-            "ResourceRecords": [{"Value": "192.168.1.1"}],
-        }
+    @pytest.mark.parametrize(
+        "record,expected_found,expected_ip",
+        [
+            (ROOT_A_RECORD, True, "192.168.1.1"),
+            ({"Type": "CNAME", "Name": "example.com."}, False, None),
+            ({"Type": "A", "Name": "www.example.com."}, False, None),
+            ({"Type": "A", "Name": "example.com."}, True, None),
+        ],
+        ids=["found", "wrong_type", "wrong_name", "no_resource_records"],
+    )
+    def test_root_a_record_match(self, record, expected_found, expected_ip):
+        """Test root A record matching and IP extraction."""
+        found, ip = _check_root_a_record(record, DOMAIN)
+
+        assert found is expected_found
+        assert ip == expected_ip
+
+    def test_root_a_record_reports_ip(self, capsys):
+        """Test the matched root A record IP is printed."""
+        _check_root_a_record(ROOT_A_RECORD, DOMAIN)
 
-        found, ip = _check_root_a_record(record, "example.com")
-
-        assert found is True
-        assert ip == "192.168.1.1"
         captured = capsys.readouterr()
-        assert "Root domain A record: 192.168.1.1" in captured.out
-
-    def test_root_a_record_wrong_type(self):
-        """Test record with wrong type."""
-        record = {"Type": "CNAME", "Name": "example.com."}
-
-        found, ip = _check_root_a_record(record, "example.com")
-
-        assert found is False
-        assert ip is None
-
-    def test_root_a_record_wrong_name(self):
-        """Test record with wrong name."""
-        record = {"Type": "A", "Name": "www.example.com."}
-
-        found, ip = _check_root_a_record(record, "example.com")
-
-        assert found is False
-        assert ip is None
-
-    def test_root_a_record_no_resource_records(self):
-        """Test A record without ResourceRecords field."""
-        record = {"Type": "A", "Name": "example.com."}
-
-        found, ip = _check_root_a_record(record, "example.com")
-
-        assert found is True
-        assert ip is None
+        assert captured.out == "  ✅ Root domain A record: 192.168.1.1\n"
 
 
 class TestCheckWwwARecord:
     """Tests for _check_www_a_record function."""
 
-    def test_www_a_record_found(self, capsys):
-        """Test finding www subdomain A record."""
-        record = {
-            "Type": "A",
-            "Name": "www.example.com.",
-            "ResourceRecords": [{"Value": "192.168.1.2"}],
-        }
-
-        found = _check_www_a_record(record, "example.com")
+    @pytest.mark.parametrize(
+        "record,expected_found",
+        [
+            (WWW_A_RECORD, True),
+            ({"Type": "CNAME", "Name": "www.example.com."}, False),
+            ({"Type": "A", "Name": "example.com."}, False),
+            ({"Type": "A", "Name": "www.example.com."}, True),
+        ],
+        ids=["found", "wrong_type", "wrong_name", "no_resource_records"],
+    )
+    def test_www_a_record_match(self, record, expected_found):
+        """Test www subdomain A record matching."""
+        assert _check_www_a_record(record, DOMAIN) is expected_found
+
+    def test_www_a_record_reports_ip(self, capsys):
+        """Test the matched www A record IP is printed."""
+        _check_www_a_record(WWW_A_RECORD, DOMAIN)
 
-        assert found is True
         captured = capsys.readouterr()
-        assert "WWW subdomain A record: 192.168.1.2" in captured.out
-
-    def test_www_a_record_wrong_type(self):
-        """Test record with wrong type."""
-        record = {"Type": "CNAME", "Name": "www.example.com."}
-
-        found = _check_www_a_record(record, "example.com")
-
-        assert found is False
-
-    def test_www_a_record_wrong_name(self):
-        """Test record with wrong name."""
-        record = {"Type": "A", "Name": "example.com."}
-
-        found = _check_www_a_record(record, "example.com")
-
-        assert found is False
-
-    def test_www_a_record_no_resource_records(self):
-        """Test www A record without ResourceRecords."""
-        record = {"Type": "A", "Name": "www.example.com."}
-
-        found = _check_www_a_record(record, "example.com")
-
-        assert found is True
+        assert captured.out == "  ✅ WWW subdomain A record: 192.168.1.2\n"
 
 
 class TestCheckCanvaTxtRecord:
     """Tests for _check_canva_txt_record function."""
 
-    def test_canva_txt_record_found(self, capsys):
-        """Test finding Canva verification TXT record."""
-        record = {
-            "Type": "TXT",
-            "Name": "_canva-domain-verify.example.com.",
-            "ResourceRecords": [{"Value": "canva-verification-code"}],
-        }
+    @pytest.mark.parametrize(
+        "record,expected_found",
+        [
+            (CANVA_TXT_RECORD, True),
+            ({"Type": "A", "Name": "_canva-domain-verify.example.com."}, False),
+            ({"Type": "TXT", "Name": "example.com."}, False),
+            ({"Type": "TXT", "Name": "_canva-domain-verify.example.com."}, True),
+        ],
+        ids=["found", "wrong_type", "wrong_name", "no_resource_records"],
+    )
+    def test_canva_txt_record_match(self, record, expected_found):
+        """Test Canva verification TXT record matching."""
+        assert _check_canva_txt_record(record) is expected_found
+
+    def test_canva_txt_record_reports_value(self, capsys):
+        """Test the matched Canva TXT record value is printed."""
+        _check_canva_txt_record(CANVA_TXT_RECORD)
 
-        found = _check_canva_txt_record(record)
-
-        assert found is True
         captured = capsys.readouterr()
-        assert "Canva verification TXT record" in captured.out
-
-    def test_canva_txt_record_wrong_type(self):
-        """Test record with wrong type."""
-        record = {"Type": "A", "Name": "_canva-domain-verify.example.com."}
-
-        found = _check_canva_txt_record(record)
-
-        assert found is False
-
-    def test_canva_txt_record_wrong_name(self):
-        """Test TXT record without Canva prefix."""
-        record = {"Type": "TXT", "Name": "example.com."}
-
-        found = _check_canva_txt_record(record)
-
-        assert found is False
-
-    def test_canva_txt_record_no_resource_records(self):
-        """Test Canva TXT record without ResourceRecords."""
-        record = {"Type": "TXT", "Name": "_canva-domain-verify.example.com."}
-
-        found = _check_canva_txt_record(record)
-
-        assert found is True
+        assert captured.out == "  ✅ Canva verification TXT record: canva-verification-code\n"
 
 
 class TestCheckDnsRecords:
     """Tests for _check_dns_records function."""
 
-    def test_check_all_records_present(self):
-        """Test when all DNS records are present."""
-        records = [
-            {
-                "Type": "A",
-                "Name": "example.com.",
-                "ResourceRecords": [{"Value": "192.168.1.1"}],
-            },
-            {
-                "Type": "A",
-                "Name": "www.example.com.",
-                "ResourceRecords": [{"Value": "192.168.1.2"}],
-            },
-            {
-                "Type": "TXT",
-                "Name": "_canva-domain-verify.example.com.",
-                "ResourceRecords": [{"Value": "verification-code"}],
-            },
-        ]
-
-        has_root, has_www, has_canva, canva_ip = _check_dns_records(records, "example.com")
-
-        assert has_root is True
-        assert has_www is True
-        assert has_canva is True
-        assert canva_ip == "192.168.1.1"
-
-    def test_check_only_root_present(self):
-        """Test when only root A record present."""
-        records = [
-            {
-                "Type": "A",
-                "Name": "example.com.",
-                "ResourceRecords": [{"Value": "192.168.1.1"}],
-            }
-        ]
-
-        has_root, has_www, has_canva, canva_ip = _check_dns_records(records, "example.com")
-
-        assert has_root is True
-        assert has_www is False
-        assert has_canva is False
-        assert canva_ip == "192.168.1.1"
-
-    def test_check_no_records(self):
-        """Test when no records present."""
-        records = []
-
-        has_root, has_www, has_canva, canva_ip = _check_dns_records(records, "example.com")
-
-        assert has_root is False
-        assert has_www is False
-        assert has_canva is False
-        assert canva_ip is None
+    @pytest.mark.parametrize(
+        "records,expected",
+        [
+            ((ROOT_A_RECORD, WWW_A_RECORD, CANVA_TXT_RECORD), (True, True, True, "192.168.1.1")),
+            ((ROOT_A_RECORD,), (True, False, False, "192.168.1.1")),
+            ((WWW_A_RECORD, CANVA_TXT_RECORD), (False, True, True, None)),
+            ((), (False, False, False, None)),
+        ],
+        ids=["all_present", "only_root", "missing_root", "no_records"],
+    )
+    def test_check_dns_records(self, records, expected):
+        """Test which required records are detected and which IP the root A record yields."""
+        assert _check_dns_records(records, DOMAIN) == expected
 
 
 class TestPrintDnsStatus:
@@ -306,7 +218,7 @@ class TestPrintDnsStatus:
 
         assert result is True
         captured = capsys.readouterr()
-        assert "All required DNS records are present" in captured.out
+        assert captured.out.endswith("  🎉 All required DNS records are present!\n")
 
     def test_some_records_missing(self, capsys):
         """Test status when some records missing."""
@@ -314,7 +226,7 @@ class TestPrintDnsStatus:
 
         assert result is False
         captured = capsys.readouterr()
-        assert "Some DNS records are missing" in captured.out
+        assert captured.out.endswith("  ⚠️  Some DNS records are missing\n")
 
     def test_no_records_present(self, capsys):
         """Test status when no records present."""
@@ -322,7 +234,7 @@ class TestPrintDnsStatus:
 
         assert result is False
         captured = capsys.readouterr()
-        assert "Some DNS records are missing" in captured.out
+        assert captured.out.endswith("  ⚠️  Some DNS records are missing\n")
 
 
 class TestBuildExistingRecordsMap:
@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import datetime
 import socket
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from cost_toolkit.scripts.setup import domain_verification_http as http_module
 from cost_toolkit.scripts.setup.domain_verification_http import (
     HTTP_STATUS_MOVED_PERMANENTLY,
     HTTP_STATUS_OK,
     HttpRequestError,
+    HttpResult,
     verify_dns_resolution,
     verify_http_connectivity,
     verify_https_connectivity,
@@ -24,14 +27,17 @@ from cost_toolkit.scripts.setup.domain_verification_ssl import (
 )
 from cost_toolkit.scripts.setup.exceptions import CertificateInfoError
 
+CERT_NOT_BEFORE = datetime.datetime(2024, 1, 1, 0, 0, 0)
+CERT_NOT_AFTER = datetime.datetime(2024, 12, 31, 23, 59, 59)
+
 
 class TestDnsResolution:
     """Tests for test_dns_resolution function."""
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_http.socket.gethostbyname")
-    def test_successful_dns_resolution(self, mock_gethostbyname, capsys):
+    def test_successful_dns_resolution(self, monkeypatch, capsys):
         """Test successful DNS resolution."""
-        mock_gethostbyname.side_effect = ["192.168.1.1", "192.168.1.2"]
+        addresses = {"example.com": "192.168.1.1", "www.example.com": "192.168.1.2"}
+        monkeypatch.setattr(http_module, "socket", SimpleNamespace(gethostbyname=addresses.__getitem__, gaierror=socket.gaierror))
 
         success, ip = verify_dns_resolution("example.com")
 
@@ -41,10 +47,13 @@ class TestDnsResolution:
         assert "example.com resolves to: 192.168.1.1" in captured.out
         assert "www.example.com resolves to: 192.168.1.2" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_http.socket.gethostbyname")
-    def test_dns_resolution_failure(self, mock_gethostbyname, capsys):
+    def test_dns_resolution_failure(self, monkeypatch, capsys):
         """Test DNS resolution failure."""
-        mock_gethostbyname.side_effect = socket.gaierror("Name or service not known")
+
+        def _unresolvable(_hostname):
+            raise socket.gaierror("Name or service not known")
+
+        monkeypatch.setattr(http_module, "socket", SimpleNamespace(gethostbyname=_unresolvable, gaierror=socket.gaierror))
 
         success, ip = verify_dns_resolution("example.com")
 
@@ -57,38 +66,34 @@ class TestDnsResolution:
 class TestHttpConnectivity:
     """Tests for test_http_connectivity function."""
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_http._http_get")
-    def test_http_redirects_to_https(self, mock_get, capsys):
-        """Test HTTP redirects to HTTPS."""
-        mock_response = MagicMock()
-        mock_response.status_code = HTTP_STATUS_MOVED_PERMANENTLY
-        mock_response.headers = {"Location": "https://example.com"}
-        mock_get.return_value = mock_response
+    @pytest.mark.parametrize(
+        "response,expected_output",
+        [
+            (
+                HttpResult(status_code=HTTP_STATUS_MOVED_PERMANENTLY, headers={"Location": "https://example.com"}),
+                "HTTP redirects to HTTPS",
+            ),
+            (HttpResult(status_code=HTTP_STATUS_OK, headers={"Location": ""}), f"HTTP response: {HTTP_STATUS_OK}"),
+        ],
+        ids=["redirects_to_https", "no_redirect"],
+    )
+    def test_http_response(self, monkeypatch, capsys, response, expected_output):
+        """Test HTTP responses are reported whether or not they redirect."""
+        monkeypatch.setattr(http_module, "_http_get", lambda _url, **_kwargs: response)
 
         result = verify_http_connectivity("example.com")
 
         assert result is True
         captured = capsys.readouterr()
-        assert "HTTP redirects to HTTPS" in captured.out
+        assert expected_output in captured.out
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_http._http_get")
-    def test_http_no_redirect(self, mock_get, capsys):
-        """Test HTTP without redirect."""
-        mock_response = MagicMock()
-        mock_response.status_code = HTTP_STATUS_OK
-        mock_response.headers = {"Location": ""}
-        mock_get.return_value = mock_response
+    def test_http_request_exception(self, monkeypatch, capsys):
+        """Test HTTP request exception."""
 
-        result = verify_http_connectivity("example.com")
+        def _failing_get(_url, **_kwargs):
+            raise HttpRequestError("Connection error")
 
-        assert result is True
-        captured = capsys.readouterr()
-        assert f"HTTP response: {HTTP_STATUS_OK}" in captured.out
-
-    @patch("cost_toolkit.scripts.setup.domain_verification_http._http_get")
-    def test_http_request_exception(self, mock_get, capsys):
-        """Test HTTP request exception."""
-        mock_get.side_effect = HttpRequestError("Connection error")
+        monkeypatch.setattr(http_module, "_http_get", _failing_get)
 
         result = verify_http_connectivity("example.com")
 
@@ -100,53 +105,45 @@ class TestHttpConnectivity:
 class TestHttpsConnectivity:
     """Tests for test_https_connectivity function."""
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_http._http_get")
-    def test_https_success_with_cloudflare(self, mock_get, capsys):
-        """Test successful HTTPS with Cloudflare."""
-        mock_response = MagicMock()
-        mock_response.status_code = HTTP_STATUS_OK
-        mock_response.headers = {"Content-Type": "text/html", "Server": "cloudflare"}
-        mock_get.return_value = mock_response
-
-        result = verify_https_connectivity("example.com")
-
-        assert result is True
-        captured = capsys.readouterr()
-        assert "HTTPS connection successful" in captured.out
-        assert "Served by Cloudflare" in captured.out
-
-    @patch("cost_toolkit.scripts.setup.domain_verification_http._http_get")
-    def test_https_success_without_cloudflare(self, mock_get, capsys):
-        """Test successful HTTPS without Cloudflare."""
-        mock_response = MagicMock()
-        mock_response.status_code = HTTP_STATUS_OK
-        mock_response.headers = {"Content-Type": "text/html", "Server": "nginx"}
-        mock_get.return_value = mock_response
+    @pytest.mark.parametrize(
+        "response,expected_result,expected_output,unexpected_output",
+        [
+            (
+                HttpResult(status_code=HTTP_STATUS_OK, headers={"Content-Type": "text/html", "Server": "cloudflare"}),
+                True,
+                ("HTTPS connection successful", "Served by Cloudflare"),
+                (),
+            ),
+            (
+                HttpResult(status_code=HTTP_STATUS_OK, headers={"Content-Type": "text/html", "Server": "nginx"}),
+                True,
+                ("HTTPS connection successful",),
+                ("Served by Cloudflare",),
+            ),
+            (HttpResult(status_code=404, headers={}), False, ("HTTPS response: 404",), ()),
+        ],
+        ids=["success_with_cloudflare", "success_without_cloudflare", "non_ok_status"],
+    )
+    def test_https_response(self, monkeypatch, capsys, response, expected_result, expected_output, unexpected_output):
+        """Test HTTPS status handling and Cloudflare detection."""
+        monkeypatch.setattr(http_module, "_http_get", lambda _url, **_kwargs: response)
 
         result = verify_https_connectivity("example.com")
 
-        assert result is True
+        assert result is expected_result
         captured = capsys.readouterr()
-        assert "HTTPS connection successful" in captured.out
-        assert "Served by Cloudflare" not in captured.out
-
-    @patch("cost_toolkit.scripts.setup.domain_verification_http._http_get")
-    def test_https_non_ok_status(self, mock_get, capsys):
-        """Test HTTPS with non-OK status."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        for text in expected_output:
+            assert text in captured.out
+        for text in unexpected_output:
+            assert text not in captured.out
 
-        result = verify_https_connectivity("example.com")
+    def test_https_request_exception(self, monkeypatch, capsys):
+        """Test HTTPS request exception."""
 
-        assert result is False
-        captured = capsys.readouterr()
-        assert "HTTPS response: 404" in captured.out
+        def _failing_get(_url, **_kwargs):
+            raise HttpRequestError("SSL error")
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_http._http_get")
-    def test_https_request_exception(self, mock_get, capsys):
-        """Test HTTPS request exception."""
-        mock_get.side_effect = HttpRequestError("SSL error")
+        monkeypatch.setattr(http_module, "_http_get", _failing_get)
 
         result = verify_https_connectivity("example.com")
 
@@ -190,8 +187,8 @@ class TestParseCertDates:
 
         not_before, not_after = _parse_cert_dates(cert)
 
-        assert not_before == datetime.datetime(2024, 1, 1, 0, 0, 0)
-        assert not_after == datetime.datetime(2024, 12, 31, 23, 59, 59)
+        assert not_before == CERT_NOT_BEFORE
+        assert not_after == CERT_NOT_AFTER
 
     def test_parse_missing_notbefore(self):
         """Test parsing certificate without notBefore."""
@@ -220,10 +217,8 @@ class TestPrintCertInfo:
         """Test printing certificate information."""
         subject_dict = {"commonName": "example.com"}
         issuer_dict = {"organizationName": "Let's Encrypt"}
-        not_before = datetime.datetime(2024, 1, 1, 0, 0, 0)
-        not_after = datetime.datetime(2024, 12, 31, 23, 59, 59)
 
-        _print_cert_info(subject_dict, issuer_dict, not_before, not_after)
+        _print_cert_info(subject_dict, issuer_dict, CERT_NOT_BEFORE, CERT_NOT_AFTER)
 
         captured = capsys.readouterr()
         assert "Certificate Subject: example.com" in captured.out
@@ -235,10 +230,8 @@ class TestPrintCertInfo:
         """Test printing certificate info with unknown fields."""
         subject_dict = {}
         issuer_dict = {}
-        not_before = datetime.datetime(2024, 1, 1, 0, 0, 0)
-        not_after = datetime.datetime(2024, 12, 31, 23, 59, 59)
 
-        _print_cert_info(subject_dict, issuer_dict, not_before, not_after)
+        _print_cert_info(subject_dict, issuer_dict, CERT_NOT_BEFORE, CERT_NOT_AFTER)
 
         captured = capsys.readouterr()
         assert "Certificate Subject: None" in captured.out
@@ -252,10 +245,8 @@ class TestCheckCertValidity:
     def test_cert_is_valid(self, mock_datetime, capsys):
         """Test valid certificate."""
         mock_datetime.datetime.now.return_value = datetime.datetime(2024, 6, 15, 0, 0, 0, tzinfo=datetime.timezone.utc)
-        not_before = datetime.datetime(2024, 1, 1, 0, 0, 0)
-        not_after = datetime.datetime(2024, 12, 31, 23, 59, 59)
 
-        result = _check_cert_validity(not_before, not_after)
+        result = _check_cert_validity(CERT_NOT_BEFORE, CERT_NOT_AFTER)
 
         assert result is True
         captured = capsys.readouterr()
@@ -266,10 +257,8 @@ class TestCheckCertValidity:
     def test_cert_is_expired(self, mock_datetime, capsys):
         """Test expired certificate."""
         mock_datetime.datetime.now.return_value = datetime.datetime(2025, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
-        not_before = datetime.datetime(2024, 1, 1, 0, 0, 0)
-        not_after = datetime.datetime(2024, 12, 31, 23, 59, 59)
 
-        result = _check_cert_validity(not_before, not_after)
+        result = _check_cert_validity(CERT_NOT_BEFORE, CERT_NOT_AFTER)
 
         assert result is False
         captured = capsys.readouterr()
@@ -279,10 +268,8 @@ class TestCheckCertValidity:
     def test_cert_not_yet_valid(self, mock_datetime, capsys):
         """Test not yet valid certificate."""
         mock_datetime.datetime.now.return_value = datetime.datetime(2023, 12, 31, 0, 0, 0, tzinfo=datetime.timezone.utc)
-        not_before = datetime.datetime(2024, 1, 1, 0, 0, 0)
-        not_after = datetime.datetime(2024, 12, 31, 23, 59, 59)
 
-        result = _check_cert_validity(not_before, not_after)
+        result = _check_cert_validity(CERT_NOT_BEFORE, CERT_NOT_AFTER)
 
         assert result is False
         captured = capsys.readouterr()
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import datetime
-from unittest.mock import MagicMock, patch
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import pytest
 from botocore.exceptions import ClientError
 
+from cost_toolkit.scripts.setup import domain_verification_ssl as ssl_module
+from cost_toolkit.scripts.setup import verify_iwannabenewyork_domain as verify_module
 from cost_toolkit.scripts.setup.domain_verification_ssl import (
     _find_hosted_zone_for_domain,
     check_ssl_certificate,
@@ -18,60 +23,57 @@ from cost_toolkit.scripts.setup.verify_iwannabenewyork_domain import (
 )
 
 
+class _FakeSSLSocket:
+    """TLS socket stub that hands back a fixed peer certificate."""
+
+    def __init__(self, cert):
+        self._cert = cert
+
+    def getpeercert(self):
+        """Return the configured certificate."""
+        return self._cert
+
+
+class _FakeSSLContext:
+    """SSL context stub whose wrapped sockets present a fixed certificate."""
+
+    def __init__(self, cert):
+        self._cert = cert
+
+    def wrap_socket(self, _sock, server_hostname):
+        """Return a context manager yielding the TLS socket stub."""
+        assert server_hostname
+        return nullcontext(_FakeSSLSocket(self._cert))
+
+
+def _install_tls_stubs(monkeypatch, cert):
+    """Route check_ssl_certificate's connection and handshake to in-memory stubs."""
+    context = _FakeSSLContext(cert)
+    monkeypatch.setattr(ssl_module, "ssl", SimpleNamespace(create_default_context=lambda: context))
+    monkeypatch.setattr(ssl_module, "socket", SimpleNamespace(create_connection=lambda _address, timeout: nullcontext(object())))
+
+
 class TestCheckSslCertificate:
     """Tests for check_ssl_certificate function."""
 
-    def test_valid_ssl_certificate(self):
+    def test_valid_ssl_certificate(self, monkeypatch):
         """Test valid SSL certificate check."""
-        module_path = "cost_toolkit.scripts.setup.domain_verification_ssl"
-        with (
-            patch(f"{module_path}.ssl.create_default_context") as mock_create_ctx,
-            patch(f"{module_path}.socket.create_connection") as mock_create_conn,
-            patch(f"{module_path}._parse_cert_dates") as mock_parse_dates,
-            patch(f"{module_path}._check_cert_validity") as mock_check_validity,
-        ):
-            mock_cert = {
-                "subject": [(("commonName", "example.com"),)],
-                "issuer": [(("organizationName", "Let's Encrypt"),)],
-            }
-
-            mock_socket = MagicMock()
-            mock_ssl_socket = MagicMock()
-            mock_ssl_socket.getpeercert.return_value = mock_cert
-
-            mock_context = MagicMock()
-            mock_context.wrap_socket.return_value.__enter__ = MagicMock(return_value=mock_ssl_socket)
-            mock_context.wrap_socket.return_value.__exit__ = MagicMock(return_value=None)
-
-            mock_create_ctx.return_value = mock_context
-            mock_create_conn.return_value.__enter__ = MagicMock(return_value=mock_socket)
-            mock_create_conn.return_value.__exit__ = MagicMock(return_value=None)
-
-            mock_parse_dates.return_value = (
-                datetime.datetime(2024, 1, 1),
-                datetime.datetime(2024, 12, 31),
-            )
-            mock_check_validity.return_value = True
-
-            result = check_ssl_certificate("example.com")
-
-            assert result is True
-
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl.ssl.create_default_context")
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl.socket.create_connection")
-    def test_no_certificate_received(self, mock_create_conn, mock_create_ctx, capsys):
-        """Test when no certificate is received."""
-        mock_socket = MagicMock()
-        mock_ssl_socket = MagicMock()
-        mock_ssl_socket.getpeercert.return_value = None
+        cert = {
+            "subject": [(("commonName", "example.com"),)],
+            "issuer": [(("organizationName", "Let's Encrypt"),)],
+        }
+        cert_dates = (datetime.datetime(2024, 1, 1), datetime.datetime(2024, 12, 31))
+        _install_tls_stubs(monkeypatch, cert)
+        monkeypatch.setattr(ssl_module, "_parse_cert_dates", lambda _cert: cert_dates)
+        monkeypatch.setattr(ssl_module, "_check_cert_validity", lambda _not_before, _not_after: True)
 
-        mock_context = MagicMock()
-        mock_context.wrap_socket.return_value.__enter__ = MagicMock(return_value=mock_ssl_socket)
-        mock_context.wrap_socket.return_value.__exit__ = MagicMock(return_value=None)
+        result = check_ssl_certificate("example.com")
+
+        assert result is True
 
-        mock_create_ctx.return_value = mock_context
-        mock_create_conn.return_value.__enter__ = MagicMock(return_value=mock_socket)
-        mock_create_conn.return_value.__exit__ = MagicMock(return_value=None)
+    def test_no_certificate_received(self, monkeypatch, capsys):
+        """Test when no certificate is received."""
+        _install_tls_stubs(monkeypatch, None)
 
         result = check_ssl_certificate("example.com")
 
@@ -79,10 +81,13 @@ class TestCheckSslCertificate:
         captured = capsys.readouterr()
         assert "No certificate received" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl.socket.create_connection")
-    def test_ssl_certificate_client_error(self, mock_create_conn, capsys):
+    def test_ssl_certificate_client_error(self, monkeypatch, capsys):
         """Test SSL certificate check with ClientError."""
-        mock_create_conn.side_effect = ClientError({"Error": {"Code": "SSLError", "Message": "SSL error"}}, "connect")
+
+        def _refuse_connection(*_args, **_kwargs):
+            raise ClientError({"Error": {"Code": "SSLError", "Message": "SSL error"}}, "connect")
+
+        monkeypatch.setattr(ssl_module, "socket", SimpleNamespace(create_connection=_refuse_connection))
 
         result = check_ssl_certificate("example.com")
 
@@ -91,16 +96,30 @@ class TestCheckSslCertificate:
         assert "SSL certificate check failed" in captured.out
 
 
+EXAMPLE_ZONE = {"Id": "/hostedzone/Z123", "Name": "example.com."}
+
+
+def _stub_route53_client(monkeypatch, module):
+    """Make the module's boto3 stub hand back one Route53 client mock and return it."""
+    client = MagicMock()
+    monkeypatch.setattr(module, "BOTO3_AVAILABLE", True)
+    monkeypatch.setattr(module, "_boto3", SimpleNamespace(client=lambda _service: client))
+    return client
+
+
+@pytest.fixture
+def route53_client(monkeypatch):
+    """Route53 client returned by the boto3 stub inside domain_verification_ssl."""
+    return _stub_route53_client(monkeypatch, ssl_module)
+
+
 class TestCanvaVerification:
     """Tests for verify_canva_verification function."""
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl.BOTO3_AVAILABLE", True)
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl._find_hosted_zone_for_domain")
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl._boto3.client")
-    def test_verify_canva_verification_found(self, mock_client, mock_find_zone, capsys):
+    def test_verify_canva_verification_found(self, monkeypatch, route53_client, capsys):
         """Test Canva verification TXT record found."""
-        mock_find_zone.return_value = {"Id": "/hostedzone/Z123", "Name": "example.com."}
-        mock_client.return_value.list_resource_record_sets.return_value = {
+        monkeypatch.setattr(ssl_module, "_find_hosted_zone_for_domain", lambda _route53, _domain: EXAMPLE_ZONE)
+        route53_client.list_resource_record_sets.return_value = {
             "ResourceRecordSets": [
                 {
                     "Type": "TXT",
@@ -116,13 +135,10 @@ class TestCanvaVerification:
         captured = capsys.readouterr()
         assert "Canva verification TXT record found" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl.BOTO3_AVAILABLE", True)
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl._find_hosted_zone_for_domain")
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl._boto3.client")
-    def test_verify_canva_verification_not_found_no_output(self, mock_client, mock_find_zone, capsys):
+    def test_verify_canva_verification_not_found_no_output(self, monkeypatch, route53_client, capsys):
         """Test Canva verification TXT record not found."""
-        mock_find_zone.return_value = {"Id": "/hostedzone/Z123", "Name": "example.com."}
-        mock_client.return_value.list_resource_record_sets.return_value = {"ResourceRecordSets": []}
+        monkeypatch.setattr(ssl_module, "_find_hosted_zone_for_domain", lambda _route53, _domain: EXAMPLE_ZONE)
+        route53_client.list_resource_record_sets.return_value = {"ResourceRecordSets": []}
 
         result = verify_canva_verification("example.com")
 
@@ -130,25 +146,19 @@ class TestCanvaVerification:
         captured = capsys.readouterr()
         assert "No Canva verification TXT record found" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl.BOTO3_AVAILABLE", True)
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl._find_hosted_zone_for_domain")
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl._boto3.client")
-    def test_verify_canva_verification_not_found_error(self, mock_client, mock_find_zone):
+    def test_verify_canva_verification_not_found_error(self, monkeypatch, route53_client):
         """Test Canva verification when hosted zone is missing."""
-        mock_find_zone.return_value = None
-        mock_client.return_value = MagicMock()
+        monkeypatch.setattr(ssl_module, "_find_hosted_zone_for_domain", lambda _route53, _domain: None)
 
         result = verify_canva_verification("example.com")
 
         assert result is False
+        route53_client.list_resource_record_sets.assert_not_called()
 
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl.BOTO3_AVAILABLE", True)
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl._find_hosted_zone_for_domain")
-    @patch("cost_toolkit.scripts.setup.domain_verification_ssl._boto3.client")
-    def test_verify_canva_verification_client_error(self, mock_client, mock_find_zone, capsys):
+    def test_verify_canva_verification_client_error(self, monkeypatch, route53_client, capsys):
         """Test Canva verification with ClientError."""
-        mock_find_zone.return_value = {"Id": "/hostedzone/Z123", "Name": "example.com."}
-        mock_client.return_value.list_resource_record_sets.side_effect = ClientError(
+        monkeypatch.setattr(ssl_module, "_find_hosted_zone_for_domain", lambda _route53, _domain: EXAMPLE_ZONE)
+        route53_client.list_resource_record_sets.side_effect = ClientError(
             {"Error": {"Code": "Error", "Message": "DNS error"}}, "ListResourceRecordSets"
         )
 
@@ -231,18 +241,19 @@ class TestPrintNameservers:
         assert "Nameservers configured" not in captured.out
 
 
+@pytest.fixture
+def verify_route53_client(monkeypatch):
+    """Route53 client returned by the boto3 stub inside verify_iwannabenewyork_domain."""
+    return _stub_route53_client(monkeypatch, verify_module)
+
+
 class TestCheckRoute53Configuration:
     """Tests for check_route53_configuration function."""
 
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain.BOTO3_AVAILABLE", True)
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain._boto3.client")
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain._find_hosted_zone_for_domain")
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain._print_nameservers")
-    def test_route53_configuration_found(self, _mock_print_ns, mock_find_zone, mock_boto_client, capsys):
+    def test_route53_configuration_found(self, monkeypatch, verify_route53_client, capsys):
         """Test successful Route53 configuration check."""
-        mock_route53 = MagicMock()
-        mock_boto_client.return_value = mock_route53
-        mock_find_zone.return_value = {"Id": "/hostedzone/Z123", "Name": "example.com."}
+        monkeypatch.setattr(verify_module, "_find_hosted_zone_for_domain", lambda _route53, _domain: EXAMPLE_ZONE)
+        monkeypatch.setattr(verify_module, "_print_nameservers", lambda _route53, _zone_id, _domain: None)
 
         result = check_route53_configuration("example.com")
 
@@ -250,35 +261,35 @@ class TestCheckRoute53Configuration:
         captured = capsys.readouterr()
         assert "Route53 hosted zone found: Z123" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain.BOTO3_AVAILABLE", True)
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain._boto3.client")
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain._find_hosted_zone_for_domain")
-    def test_route53_configuration_not_found(self, mock_find_zone, mock_boto_client, capsys):
+    def test_route53_configuration_not_found(self, monkeypatch, verify_route53_client, capsys):
         """Test Route53 configuration when zone not found."""
-        mock_route53 = MagicMock()
-        mock_boto_client.return_value = mock_route53
-        mock_find_zone.return_value = None
+        monkeypatch.setattr(verify_module, "_find_hosted_zone_for_domain", lambda _route53, _domain: None)
 
         result = check_route53_configuration("example.com")
 
         assert result is False
+        verify_route53_client.list_resource_record_sets.assert_not_called()
         captured = capsys.readouterr()
         assert "No Route53 hosted zone found" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain.BOTO3_AVAILABLE", False)
-    def test_route53_configuration_boto3_unavailable(self, capsys):
+    def test_route53_configuration_boto3_unavailable(self, monkeypatch, capsys):
         """Test Route53 check when boto3 is unavailable."""
+        monkeypatch.setattr(verify_module, "BOTO3_AVAILABLE", False)
+
         result = check_route53_configuration("example.com")
 
         assert result is False
         captured = capsys.readouterr()
         assert "boto3 not available" in captured.out
 
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain.BOTO3_AVAILABLE", True)
-    @patch("cost_toolkit.scripts.setup.verify_iwannabenewyork_domain._boto3.client")
-    def test_route53_configuration_client_error(self, mock_boto_client, capsys):
+    def test_route53_configuration_client_error(self, monkeypatch, capsys):
         """Test Route53 check with ClientError."""
-        mock_boto_client.side_effect = ClientError({"Error": {"Code": "AccessDenied", "Message": "Access denied"}}, "list_hosted_zones")
+
+        def _denied_client(_service):
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "Access denied"}}, "list_hosted_zones")
+
+        monkeypatch.setattr(verify_module, "BOTO3_AVAILABLE", True)
+        monkeypatch.setattr(verify_module, "_boto3", SimpleNamespace(client=_denied_client))
 
         result = check_route53_configuration("example.com")
 
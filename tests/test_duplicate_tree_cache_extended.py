@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from contextlib import closing
+
+import pytest
 
 from duplicate_tree.analysis import (
     MIN_REPORT_BYTES,
     MIN_REPORT_FILES,
     ScanFingerprint,
     cache_key,
+    clusters_to_rows,
 )
 from duplicate_tree.cache import (
     EXACT_TOLERANCE,
@@ -21,142 +25,132 @@ from duplicate_tree.cache import (
 from duplicate_tree.core import DuplicateCluster
 from duplicate_tree.models import DirectoryNode
 
+BASE_PATH = "/base/path"
+ABC_FINGERPRINT = ScanFingerprint(total_files=10, checksum="abc123")
+ABC_KEY = cache_key(ABC_FINGERPRINT, min_files=MIN_REPORT_FILES, min_bytes=MIN_REPORT_BYTES)
+GOOD_FINGERPRINT = ScanFingerprint(total_files=2, checksum="good")
+GOOD_KEY = cache_key(GOOD_FINGERPRINT, min_files=MIN_REPORT_FILES, min_bytes=MIN_REPORT_BYTES)
+GENERATED_AT = "2024-01-01T00:00:00"
+INSERT_CACHE_ROW_SQL = """
+INSERT INTO duplicate_tree_cache (
+    fingerprint, tolerance, base_path, total_files, generated_at, report
+) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _insert_cache_rows(conn, rows):
+    """Seed (key, total_files, report) rows under BASE_PATH in a single transaction."""
+    conn.execute("BEGIN")
+    conn.executemany(
+        INSERT_CACHE_ROW_SQL, [(key, EXACT_TOLERANCE, BASE_PATH, total_files, GENERATED_AT, report) for key, total_files, report in rows]
+    )
+    conn.execute("COMMIT")
 
-def test_ensure_cache_table_idempotent(tmp_path):
-    """Test that ensure_cache_table can be called multiple times safely."""
-    db_path = tmp_path / "cache.db"
-    conn = sqlite3.connect(str(db_path))
 
+@pytest.fixture(scope="module")
+def cache_db_file(tmp_path_factory):
+    """Cache database path and autocommit connection, with the schema created once per module."""
+    db_path = tmp_path_factory.mktemp("duplicate_tree_cache") / "cache.db"
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
     ensure_cache_table(conn)
-    ensure_cache_table(conn)
+    yield db_path, conn
+    conn.close()
+
+
+@pytest.fixture
+def cache_db(cache_db_file):
+    """Shared cache database emptied before each test."""
+    db_path, conn = cache_db_file
+    conn.execute("DELETE FROM duplicate_tree_cache")
+    return db_path, conn
 
-    cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='duplicate_tree_cache'")
-    result = cursor.fetchone()
+
+def test_ensure_cache_table_idempotent():
+    """Test that ensure_cache_table can be called multiple times safely."""
+    with closing(sqlite3.connect(":memory:")) as conn:
+        ensure_cache_table(conn)
+        ensure_cache_table(conn)
+
+        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='duplicate_tree_cache'")
+        result = cursor.fetchone()
     assert result is not None
-    conn.close()
 
 
-def test_load_cached_report_no_match(tmp_path):
+def test_load_cached_report_no_match(cache_db):
     """Test load_cached_report returns None when no match exists."""
-    db_path = tmp_path / "cache.db"
+    db_path, _ = cache_db
     fingerprint = ScanFingerprint(total_files=10, checksum="nonexistent")
 
-    result = load_cached_report(CacheLocation(db_path=str(db_path), fingerprint=fingerprint, base_path="/base/path"))
+    result = load_cached_report(CacheLocation(db_path=str(db_path), fingerprint=fingerprint, base_path=BASE_PATH))
     assert result is None
 
 
-def test_load_cached_report_file_count_mismatch(tmp_path):
+def test_load_cached_report_file_count_mismatch(cache_db):
     """Test load_cached_report returns None when file count doesn't match."""
-    db_path = tmp_path / "cache.db"
-    conn = sqlite3.connect(str(db_path))
-    ensure_cache_table(conn)
+    db_path, conn = cache_db
 
-    fingerprint = ScanFingerprint(total_files=10, checksum="abc123")
-    key = cache_key(fingerprint, min_files=2, min_bytes=512 * 1024 * 1024)
+    _insert_cache_rows(conn, [(ABC_KEY, 99, "[]")])
 
-    conn.execute(
-        """
-        INSERT INTO duplicate_tree_cache (
-            fingerprint, tolerance, base_path, total_files, generated_at, report
-        ) VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (key, EXACT_TOLERANCE, "/base/path", 99, "2024-01-01T00:00:00", "[]"),
-    )
-    conn.commit()
-    conn.close()
-
-    result = load_cached_report(CacheLocation(db_path=str(db_path), fingerprint=fingerprint, base_path="/base/path"))
+    result = load_cached_report(CacheLocation(db_path=str(db_path), fingerprint=ABC_FINGERPRINT, base_path=BASE_PATH))
     assert result is None
 
 
-def test_load_cached_report_invalid_json(tmp_path):
+def test_load_cached_report_invalid_json(cache_db):
     """Test load_cached_report handles invalid JSON gracefully."""
-    db_path = tmp_path / "cache.db"
-    conn = sqlite3.connect(str(db_path))
-    ensure_cache_table(conn)
+    db_path, conn = cache_db
 
-    fingerprint = ScanFingerprint(total_files=10, checksum="abc123")
-    key = cache_key(fingerprint, min_files=2, min_bytes=512 * 1024 * 1024)
-
-    conn.execute(
-        """
-        INSERT INTO duplicate_tree_cache (
-            fingerprint, tolerance, base_path, total_files, generated_at, report
-        ) VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (key, EXACT_TOLERANCE, "/base/path", 10, "2024-01-01T00:00:00", "INVALID JSON"),
-    )
-    conn.commit()
-    conn.close()
+    _insert_cache_rows(conn, [(ABC_KEY, 10, "INVALID JSON")])
 
-    result = load_cached_report(CacheLocation(db_path=str(db_path), fingerprint=fingerprint, base_path="/base/path"))
+    result = load_cached_report(CacheLocation(db_path=str(db_path), fingerprint=ABC_FINGERPRINT, base_path=BASE_PATH))
     assert result is not None
     assert "report" in result
     assert result["report"] == "INVALID JSON"
 
 
-def test_load_cached_report_valid_payload(tmp_path):
+def test_load_cached_report_valid_payload(cache_db):
     """Test load_cached_report returns parsed rows on valid payload."""
-    db_path = tmp_path / "cache.db"
-    conn = sqlite3.connect(str(db_path))
-    ensure_cache_table(conn)
-
-    fingerprint = ScanFingerprint(total_files=2, checksum="good")
-    key = cache_key(fingerprint, min_files=MIN_REPORT_FILES, min_bytes=MIN_REPORT_BYTES)
+    db_path, conn = cache_db
     payload = '[{"total_files": 2, "total_size": 10, "nodes": []}]'
 
-    conn.execute(
-        """
-        INSERT INTO duplicate_tree_cache (
-            fingerprint, tolerance, base_path, total_files, generated_at, report
-        ) VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (key, EXACT_TOLERANCE, "/base/path", 2, "2024-01-02T00:00:00", payload),
-    )
-    conn.commit()
-    conn.close()
+    _insert_cache_rows(conn, [(GOOD_KEY, 2, payload)])
 
-    result = load_cached_report(CacheLocation(db_path=str(db_path), fingerprint=fingerprint, base_path="/base/path"))
+    result = load_cached_report(CacheLocation(db_path=str(db_path), fingerprint=GOOD_FINGERPRINT, base_path=BASE_PATH))
 
     assert result is not None
     assert result["rows"] == [{"total_files": 2, "total_size": 10, "nodes": []}]
     assert result["total_files"] == "2"
 
 
-def test_store_cached_report_with_clusters(tmp_path):
+def test_store_cached_report_with_clusters(cache_db):
     """Test store_cached_report persists cluster data correctly."""
-    db_path = tmp_path / "cache.db"
-    fingerprint = ScanFingerprint(total_files=10, checksum="abc123")
+    db_path, conn = cache_db
 
     node1 = DirectoryNode(path=("bucket", "dir1"), total_files=5, total_size=1000)
     node2 = DirectoryNode(path=("bucket", "dir2"), total_files=5, total_size=1000)
     cluster = DuplicateCluster(signature="sig1", nodes=[node1, node2])
 
-    store_cached_report(CacheLocation(db_path=str(db_path), fingerprint=fingerprint, base_path="/base/path"), [cluster])
+    store_cached_report(CacheLocation(db_path=str(db_path), fingerprint=ABC_FINGERPRINT, base_path=BASE_PATH), [cluster])
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute("SELECT * FROM duplicate_tree_cache").fetchall()
-    conn.close()
+    rows = conn.execute("SELECT total_files, report FROM duplicate_tree_cache").fetchall()
 
     assert len(rows) == 1
-    assert rows[0]["total_files"] == 10
+    total_files, report = rows[0]
+    assert total_files == 10
 
-    report_data = json.loads(rows[0]["report"])
-    assert len(report_data) == 1
-    assert report_data[0]["total_files"] == 5
+    expected_rows = clusters_to_rows([cluster])
+    assert [row["total_files"] for row in expected_rows] == [5]
+    assert report == json.dumps(expected_rows)
 
 
-def test_store_cached_report_replaces_existing(tmp_path):
+def test_store_cached_report_replaces_existing(cache_db):
     """Test store_cached_report replaces existing entries."""
-    db_path = tmp_path / "cache.db"
-    fingerprint = ScanFingerprint(total_files=10, checksum="abc123")
+    db_path, conn = cache_db
 
-    store_cached_report(CacheLocation(db_path=str(db_path), fingerprint=fingerprint, base_path="/base/path"), [])
-    store_cached_report(CacheLocation(db_path=str(db_path), fingerprint=fingerprint, base_path="/base/path"), [])
+    store_cached_report(CacheLocation(db_path=str(db_path), fingerprint=ABC_FINGERPRINT, base_path=BASE_PATH), [])
+    store_cached_report(CacheLocation(db_path=str(db_path), fingerprint=ABC_FINGERPRINT, base_path=BASE_PATH), [])
 
-    conn = sqlite3.connect(str(db_path))
     count = conn.execute("SELECT COUNT(*) FROM duplicate_tree_cache").fetchone()[0]
-    conn.close()
 
     assert count == 1
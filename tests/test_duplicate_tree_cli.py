@@ -2,29 +2,46 @@
 
 from __future__ import annotations
 
+import shutil
 import sqlite3
 from pathlib import Path
 
+import pytest
+
 from duplicate_tree.analysis import ScanFingerprint, build_directory_index_from_db
 from duplicate_tree.cache import CacheLocation, load_cached_report, store_cached_report
 from duplicate_tree.cli import main
-from tests.assertions import assert_equal
+from tests.assertions import assert_contains_all, assert_equal
 
 MIN_DUPLICATE_DIRECTORIES = 2
+FILES_TABLE_SQL = """
+CREATE TABLE files (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    local_checksum TEXT,
+    etag TEXT
+)
+"""
+INSERT_FILE_SQL = "INSERT INTO files (bucket, key, size, local_checksum, etag) VALUES (?, ?, ?, ?, ?)"
+
+
+def _write_files_db(db_path: Path, rows) -> Path:
+    """Create a files table holding rows in one transaction, skipping journal fsyncs."""
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("BEGIN")
+        conn.execute(FILES_TABLE_SQL)
+        conn.executemany(INSERT_FILE_SQL, rows)
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return db_path
 
 
 def _write_sample_db(tmp_path: Path) -> Path:
-    db_path = tmp_path / "state.db"
-    conn = sqlite3.connect(db_path)
-    conn.execute("""
-        CREATE TABLE files (
-            bucket TEXT NOT NULL,
-            key TEXT NOT NULL,
-            size INTEGER NOT NULL,
-            local_checksum TEXT,
-            etag TEXT
-        )
-        """)
     large = 600 * 1024 * 1024  # 0.56 GiB
     rows = [
         ("bucket", "dirA/file1.txt", large, "aaa", None),
@@ -34,19 +51,24 @@ def _write_sample_db(tmp_path: Path) -> Path:
         ("bucket", "dirB/sub/file2.txt", large, "bbb", None),
         ("bucket", "dirB/extra/file3.bin", large, "ccc", None),
     ]
-    conn.executemany(
-        "INSERT INTO files (bucket, key, size, local_checksum, etag) VALUES (?, ?, ?, ?, ?)",
-        rows,
-    )
-    conn.commit()
-    conn.close()
-    return db_path
+    return _write_files_db(tmp_path / "state.db", rows)
 
 
-def test_build_directory_index_from_db(tmp_path):
+@pytest.fixture(scope="module")
+def sample_db_template(tmp_path_factory) -> Path:
+    """Sample database written once per module; read-only tests may scan it in place."""
+    return _write_sample_db(tmp_path_factory.mktemp("sample_db"))
+
+
+@pytest.fixture
+def sample_db(sample_db_template, tmp_path) -> Path:
+    """Per-test copy of the sample database that the CLI may write its cache into."""
+    return Path(shutil.copyfile(sample_db_template, tmp_path / "state.db"))
+
+
+def test_build_directory_index_from_db(sample_db_template):
     """Test building directory index from database."""
-    db_path = _write_sample_db(tmp_path)
-    index, fingerprint = build_directory_index_from_db(str(db_path))
+    index, fingerprint = build_directory_index_from_db(str(sample_db_template))
     assert_equal(fingerprint.total_files, 6)
     assert len(index.nodes) >= MIN_DUPLICATE_DIRECTORIES
 
@@ -64,11 +86,10 @@ def test_cache_round_trip(tmp_path):
     assert "rows" in cached
 
 
-def test_cli_main_end_to_end(tmp_path, capsys):
+def test_cli_main_end_to_end(tmp_path, sample_db, capsys):
     """Test CLI main function end-to-end with caching."""
-    db_path = _write_sample_db(tmp_path)
+    db_path = sample_db
     base_path = tmp_path / "drive"
-    base_path.mkdir()
     exit_code = main(
         [
             "--db-path",
@@ -80,10 +101,9 @@ def test_cli_main_end_to_end(tmp_path, capsys):
     )
     captured = capsys.readouterr().out
     assert exit_code == 0
-    assert "EXACT DUPLICATE TREES" in captured
+    assert_contains_all(captured, "EXACT DUPLICATE TREES", "GiB")
     assert "NEAR DUPLICATES" not in captured
     assert "dirA/sub" not in captured
-    assert "GiB" in captured
 
     exit_code_cached = main(
         [
@@ -100,29 +120,12 @@ def test_cli_main_end_to_end(tmp_path, capsys):
 
 def test_threshold_filters_small_clusters(tmp_path, capsys):
     """Test that threshold filters out small clusters."""
-    db_path = tmp_path / "small.db"
-    conn = sqlite3.connect(db_path)
-    conn.execute("""
-        CREATE TABLE files (
-            bucket TEXT NOT NULL,
-            key TEXT NOT NULL,
-            size INTEGER NOT NULL,
-            local_checksum TEXT,
-            etag TEXT
-        )
-        """)
     rows = [
         ("bucket", "tinyA/file1.txt", 10, "aaa", None),
         ("bucket", "tinyB/file1.txt", 10, "aaa", None),
     ]
-    conn.executemany(
-        "INSERT INTO files (bucket, key, size, local_checksum, etag) VALUES (?, ?, ?, ?, ?)",
-        rows,
-    )
-    conn.commit()
-    conn.close()
+    db_path = _write_files_db(tmp_path / "small.db", rows)
     base_path = tmp_path / "drive_small"
-    base_path.mkdir()
     exit_code = main(
         [
             "--db-path",
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 from cost_toolkit.scripts.rds.explore_aurora_data import (
     MAX_SAMPLE_COLUMNS,
     PSYCOPG2_AVAILABLE,
+    _resolve_psycopg2,
     explore_aurora_database,
 )
 from tests.explore_aurora_data_fixtures import (
@@ -38,6 +39,30 @@ def test_explore_aurora_database_no_psycopg2(capsys):
     assert "pip install psycopg2-binary" in captured.out
 
 
+def test_explore_aurora_database_reports_missing_psycopg2_every_call(capsys):
+    """Test the install hint is printed on each call even though the driver lookup is cached."""
+    with patch("cost_toolkit.scripts.rds.explore_aurora_data.PSYCOPG2_AVAILABLE", False):
+        assert explore_aurora_database() is False
+        assert explore_aurora_database() is False
+
+    captured = capsys.readouterr()
+    assert captured.out.count("pip install psycopg2-binary") == 2
+
+
+def test_resolve_psycopg2_imports_driver_once():
+    """Test _resolve_psycopg2 imports the driver once and reuses the module."""
+    driver = MagicMock()
+    with (
+        patch("cost_toolkit.scripts.rds.explore_aurora_data.PSYCOPG2_AVAILABLE", True),
+        patch("cost_toolkit.scripts.rds.explore_aurora_data.psycopg2", None),
+        patch("cost_toolkit.scripts.rds.explore_aurora_data._import_psycopg2", return_value=driver) as mock_import,
+    ):
+        assert _resolve_psycopg2() is driver
+        assert _resolve_psycopg2() is driver
+
+    mock_import.assert_called_once_with()
+
+
 def test_main_function():
     """Test main function calls explore_aurora_database."""
     assert_main_invokes_explore()
@@ -13,6 +13,8 @@ import pytest
 
 from migration_state_v2 import Phase
 
+pytestmark = pytest.mark.usefixtures("aws_cli_on_path")
+
 
 class TestS3MigrationV2Initialization:
     """Tests for S3MigrationV2 initialization."""
@@ -47,21 +49,19 @@ def test_signal_handler_prints_message(migrator, capsys):
     assert "State has been saved" in captured.out
 
 
-def test_run_already_complete(migrator, mock_dependencies, capsys):
+def test_run_already_complete(migrator, mock_dependencies, capsys, monkeypatch):
     """run() shows completion message when already complete."""
     mock_dependencies["state"].get_current_phase.return_value = Phase.COMPLETE
+    monkeypatch.setattr("migrate_v2.check_drive_available", lambda base_path: None)
+    monkeypatch.setattr("migrate_v2.show_migration_status", lambda state: None)
 
-    with pytest.MonkeyPatch.context() as mp:
-        mp.setattr("migrate_v2.check_drive_available", lambda base_path: None)
-        mp.setattr("migrate_v2.show_migration_status", lambda state: None)
-        mp.setattr("shutil.which", lambda cmd: "/usr/bin/aws")
-        migrator.run()
+    migrator.run()
 
     captured = capsys.readouterr()
     assert "Migration already complete" in captured.out
 
 
-def test_run_from_scanning_phase(migrator, mock_dependencies, capsys):
+def test_run_from_scanning_phase(migrator, mock_dependencies, patched_phases, capsys):
     """run() executes all phases starting from SCANNING."""
     mock_dependencies["state"].get_current_phase.side_effect = [
         Phase.SCANNING,
@@ -69,40 +69,32 @@ def test_run_from_scanning_phase(migrator, mock_dependencies, capsys):
         Phase.COMPLETE,
     ]
 
-    with pytest.MonkeyPatch.context() as mp:
-        mp.setattr("migrate_v2.scan_all_buckets", lambda s3, state, interrupted: None)
-        mp.setattr("migrate_v2.request_all_restores", lambda s3, state, interrupted: None)
-        mp.setattr("migrate_v2.wait_for_restores", lambda s3, state, interrupted: None)
-        mp.setattr("migrate_v2.migrate_all_buckets", lambda s3, state, base_path, drive_checker, interrupted: None)
-        mp.setattr("migrate_v2.check_drive_available", lambda base_path: None)
-        mp.setattr("shutil.which", lambda cmd: "/usr/bin/aws")
-        migrator.run()
+    migrator.run()
+
+    assert patched_phases == ["scan", "restore", "wait", "migrate"]
 
     captured = capsys.readouterr()
     assert "S3 MIGRATION V2" in captured.out
 
 
-def test_run_calls_check_drive_available(migrator, mock_dependencies):
+def test_run_calls_check_drive_available(migrator, mock_dependencies, monkeypatch):
     """run() calls check_drive_available before starting."""
     mock_dependencies["state"].get_current_phase.return_value = Phase.COMPLETE
     called = []
+    monkeypatch.setattr("migrate_v2.check_drive_available", lambda base_path: called.append(base_path))
+    monkeypatch.setattr("migrate_v2.show_migration_status", lambda state: None)
 
-    with pytest.MonkeyPatch.context() as mp:
-        mp.setattr("migrate_v2.check_drive_available", lambda base_path: called.append(base_path))
-        mp.setattr("migrate_v2.show_migration_status", lambda state: None)
-        mp.setattr("shutil.which", lambda cmd: "/usr/bin/aws")
-        migrator.run()
+    migrator.run()
 
     assert len(called) == 1
 
 
-def test_show_status(migrator, mock_dependencies):
+def test_show_status(migrator, mock_dependencies, monkeypatch):
     """show_status() delegates to show_migration_status."""
     called = []
+    monkeypatch.setattr("migrate_v2.show_migration_status", lambda state: called.append(state))
 
-    with pytest.MonkeyPatch.context() as mp:
-        mp.setattr("migrate_v2.show_migration_status", lambda state: called.append(state))
-        migrator.show_status()
+    migrator.show_status()
 
     assert len(called) == 1
     assert called[0] == mock_dependencies["state"]
@@ -21,25 +21,18 @@ def test_signal_handler_sets_interrupted_event(migrator):
     assert migrator.interrupted.is_set()
 
 
-def test_run_handles_interrupted_scanning(migrator, mock_dependencies):
+def test_run_handles_interrupted_scanning(migrator, mock_dependencies, patched_phases, monkeypatch):
     """run() handles interruption during scanning."""
-    called = []
 
     # Set up to interrupt during scanning
     def interrupt_during_scan(s3, state, interrupted):
         interrupted.set()
-        called.append("scan")
+        patched_phases.append("scan")
 
     mock_dependencies["state"].get_current_phase.return_value = Phase.SCANNING
+    monkeypatch.setattr("migrate_v2.scan_all_buckets", interrupt_during_scan)
 
-    with pytest.MonkeyPatch.context() as mp:
-        mp.setattr("migrate_v2.scan_all_buckets", interrupt_during_scan)
-        mp.setattr("migrate_v2.request_all_restores", lambda s3, state, interrupted: called.append("restore"))
-        mp.setattr("migrate_v2.wait_for_restores", lambda s3, state, interrupted: called.append("wait"))
-        mp.setattr("migrate_v2.migrate_all_buckets", lambda s3, state, base_path, drive_checker, interrupted: called.append("migrate"))
-        mp.setattr("migrate_v2.check_drive_available", lambda base_path: None)
-        mp.setattr("shutil.which", lambda cmd: "/usr/bin/aws")
-        migrator.run()
+    migrator.run()
 
     # Scanner should have been called
-    assert "scan" in called
+    assert "scan" in patched_phases
@@ -6,111 +6,118 @@ Tests cover:
 - Edge cases for main() function
 """
 
-import sys
-from unittest import mock
+from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+import migrate_v2
 from migrate_v2 import S3MigrationV2, create_migrator, main
 
+STATE_DB_PATH = "/tmp/state.db"
+LOCAL_BASE_PATH = "/tmp/s3_backup"
+
 
 class TestCreateMigrator:
     """Tests for create_migrator factory function."""
 
     @pytest.fixture
-    def mock_config(self):
-        """Mock config module."""
-        with mock.patch("migrate_v2.config") as mock_cfg:
-            mock_cfg.STATE_DB_PATH = "/tmp/state.db"
-            mock_cfg.LOCAL_BASE_PATH = "/tmp/s3_backup"
-            yield mock_cfg
-
-    def test_create_migrator_returns_s3_migration_v2(self):
+    def dependencies(self, monkeypatch):
+        """Swap create_migrator's collaborators for sentinels and record how they are built."""
+        built = SimpleNamespace(state=object(), s3=object(), calls=[])
+
+        def _state(db_path):
+            built.calls.append(("state", db_path))
+            return built.state
+
+        def _client(service):
+            built.calls.append(("client", service))
+            return built.s3
+
+        monkeypatch.setattr(migrate_v2, "config", SimpleNamespace(STATE_DB_PATH=STATE_DB_PATH, LOCAL_BASE_PATH=LOCAL_BASE_PATH))
+        monkeypatch.setattr(migrate_v2, "MigrationStateV2", _state)
+        monkeypatch.setattr(migrate_v2, "boto3", SimpleNamespace(client=_client))
+        return built
+
+    def test_create_migrator_returns_s3_migration_v2(self, dependencies):
         """create_migrator returns S3MigrationV2 instance."""
-        with (
-            mock.patch("migrate_v2.MigrationStateV2"),
-            mock.patch("migrate_v2.boto3.client"),
-            mock.patch("migrate_v2.Path"),
-        ):
-            migrator = create_migrator()
-
-            assert isinstance(migrator, S3MigrationV2)
-            assert migrator.s3 is not None
-            assert migrator.state is not None
-            assert migrator.base_path is not None
-
-    def test_create_migrator_instantiates_all_dependencies(self, mock_config):
+        migrator = create_migrator()
+
+        assert isinstance(migrator, S3MigrationV2)
+        assert migrator.s3 is dependencies.s3
+        assert migrator.state is dependencies.state
+        assert migrator.base_path == Path(LOCAL_BASE_PATH)
+
+    def test_create_migrator_instantiates_all_dependencies(self, dependencies):
         """create_migrator creates all required dependencies."""
-        with (
-            mock.patch("migrate_v2.MigrationStateV2") as mock_state_class,
-            mock.patch("migrate_v2.boto3.client") as mock_boto3,
-            mock.patch("migrate_v2.Path"),
-        ):
+        create_migrator()
+
+        assert dependencies.calls == [("state", STATE_DB_PATH), ("client", "s3")]
+
+
+class _StubMigrator:
+    """Stand-in migrator that records which entry points main() invokes."""
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self):
+        """Record a migration run."""
+        self.calls.append("run")
+
+    def show_status(self):
+        """Record a status request."""
+        self.calls.append("show_status")
 
-            create_migrator()
+    def reset(self):
+        """Record a reset request."""
+        self.calls.append("reset")
 
-            # Verify core dependencies were instantiated
-            mock_state_class.assert_called_once_with(mock_config.STATE_DB_PATH)
-            mock_boto3.assert_called_once_with("s3")
+
+@pytest.fixture
+def stub_migrator(monkeypatch):
+    """Make main() build a _StubMigrator, recording each creation in its calls."""
+    migrator = _StubMigrator()
+
+    def _create():
+        migrator.calls.append("create")
+        return migrator
+
+    monkeypatch.setattr(migrate_v2, "create_migrator", _create)
+    return migrator
 
 
 class TestMain:
     """Tests for main entry point."""
 
-    @pytest.fixture
-    def mock_migrator(self):
-        """Mock migrator instance."""
-        with mock.patch("migrate_v2.create_migrator") as mock_create:
-            mock_migrator_instance = mock.Mock(spec=S3MigrationV2)
-            mock_create.return_value = mock_migrator_instance
-            yield mock_migrator_instance
-
-    def test_main_no_command_runs_migration(self, mock_migrator, monkeypatch):
+    def test_main_no_command_runs_migration(self, stub_migrator):
         """main() runs migration when no command provided."""
-        monkeypatch.setattr(sys, "argv", ["migrate_v2.py"])
-
-        main()
+        main([])
 
-        mock_migrator.run.assert_called_once()
-        mock_migrator.show_status.assert_not_called()
-        mock_migrator.reset.assert_not_called()
+        assert stub_migrator.calls == ["create", "run"]
 
-    def test_main_status_command_shows_status(self, mock_migrator, monkeypatch):
+    def test_main_status_command_shows_status(self, stub_migrator):
         """main() shows status when 'status' command provided."""
-        monkeypatch.setattr(sys, "argv", ["migrate_v2.py", "status"])
-
-        main()
+        main(["status"])
 
-        mock_migrator.show_status.assert_called_once()
-        mock_migrator.run.assert_not_called()
-        mock_migrator.reset.assert_not_called()
+        assert stub_migrator.calls == ["create", "show_status"]
 
-    def test_main_reset_command_resets_state(self, mock_migrator, monkeypatch):
+    def test_main_reset_command_resets_state(self, stub_migrator):
         """main() resets state when 'reset' command provided."""
-        monkeypatch.setattr(sys, "argv", ["migrate_v2.py", "reset"])
+        main(["reset"])
 
-        main()
+        assert stub_migrator.calls == ["create", "reset"]
 
-        mock_migrator.reset.assert_called_once()
-        mock_migrator.run.assert_not_called()
-        mock_migrator.show_status.assert_not_called()
-
-    def test_main_creates_migrator(self, monkeypatch):
+    def test_main_creates_migrator(self, stub_migrator):
         """main() creates migrator instance."""
-        monkeypatch.setattr(sys, "argv", ["migrate_v2.py"])
-
-        with mock.patch("migrate_v2.create_migrator") as mock_create:
-            mock_create.return_value = mock.Mock(spec=S3MigrationV2)
-            main()
+        main([])
 
-            mock_create.assert_called_once()
+        assert stub_migrator.calls.count("create") == 1
 
-    def test_main_help_text(self, capsys, monkeypatch):
+    def test_main_help_text(self, capsys):
         """main() displays help with -h flag."""
-        monkeypatch.setattr(sys, "argv", ["migrate_v2.py", "-h"])
-
         with pytest.raises(SystemExit) as exc_info:
-            main()
+            main(["-h"])
 
         assert exc_info.value.code == 0
         captured = capsys.readouterr()
@@ -120,26 +127,16 @@ class TestMain:
 class TestMainEdgeCases:
     """Tests for edge cases in main entry point."""
 
-    def test_main_with_empty_args(self, monkeypatch):
+    def test_main_with_empty_args(self, stub_migrator):
         """main() runs migration with no command specified."""
-        monkeypatch.setattr(sys, "argv", ["migrate_v2.py"])
+        main([])
 
-        with mock.patch("migrate_v2.create_migrator") as mock_create:
-            mock_migrator_instance = mock.Mock(spec=S3MigrationV2)
-            mock_create.return_value = mock_migrator_instance
+        assert "run" in stub_migrator.calls
 
-            main()
-
-            mock_migrator_instance.run.assert_called_once()
-
-    def test_main_parser_accepts_valid_commands(self, monkeypatch):
+    def test_main_parser_accepts_valid_commands(self, stub_migrator):
         """main() parser accepts status and reset commands."""
         for command in ["status", "reset"]:
-            monkeypatch.setattr(sys, "argv", ["migrate_v2.py", command])
-
-            with mock.patch("migrate_v2.create_migrator") as mock_create:
-                mock_migrator_instance = mock.Mock(spec=S3MigrationV2)
-                mock_create.return_value = mock_migrator_instance
+            # Should not raise
+            main([command])
 
-                # Should not raise
-                main()
+        assert stub_migrator.calls == ["create", "show_status", "create", "reset"]
@@ -10,6 +10,11 @@ import pytest
 import migrate_v2
 from migration_state_v2 import Phase
 
+pytestmark = pytest.mark.usefixtures("aws_cli_on_path")
+
+FULL_PHASE_SEQUENCE = (Phase.SCANNING, Phase.GLACIER_RESTORE, Phase.GLACIER_WAIT, Phase.SYNCING, Phase.COMPLETE)
+RESTORE_PHASE_SEQUENCE = (Phase.GLACIER_RESTORE, Phase.COMPLETE)
+
 
 def _override_state_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, create: bool) -> Path:
     """Point migrate_v2.STATE_DB_PATH at a temp file for reset tests."""
@@ -23,129 +28,63 @@ def _override_state_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, creat
 class TestResetFlow:
     """Reset command confirmation flows."""
 
-    def test_reset_with_yes_confirmation(self, monkeypatch, capsys, tmp_path, migrator):
-        """Test reset with 'yes' confirmation."""
-        state_db = _override_state_db(tmp_path, monkeypatch, create=True)
-
-        with mock.patch("builtins.input", return_value="yes"):
-            migrator.reset()
-
-        assert state_db.exists()
-        captured = capsys.readouterr()
-        assert "RESET MIGRATION" in captured.out
-
-    def test_reset_with_no_confirmation(self, monkeypatch, capsys, tmp_path, migrator):
-        """Test reset with 'no' confirmation."""
-        state_db = _override_state_db(tmp_path, monkeypatch, create=True)
-
-        with mock.patch("builtins.input", return_value="no"):
-            migrator.reset()
-
-        assert state_db.exists()
+    @pytest.mark.parametrize(
+        ("answer", "db_exists", "expected_output"),
+        [
+            pytest.param("yes", (True, True), ("RESET MIGRATION", "State database reset"), id="yes_confirmation"),
+            pytest.param("no", (True, True), ("Reset cancelled",), id="no_confirmation"),
+            pytest.param("yes", (False, True), ("Created fresh state database",), id="database_missing"),
+            pytest.param("YES", (True, True), ("State database reset",), id="case_insensitive_confirmation"),
+            pytest.param("no", (False, False), ("RESET MIGRATION", "delete all migration state"), id="prints_header_message"),
+        ],
+    )
+    def test_reset_confirmation(self, monkeypatch, capsys, tmp_path, migrator, answer, db_exists, expected_output):
+        """Reset honours the confirmation answer; db_exists is the (before, after) state of the database."""
+        exists_before, exists_after = db_exists
+        state_db = _override_state_db(tmp_path, monkeypatch, create=exists_before)
+        monkeypatch.setattr("builtins.input", lambda _prompt: answer)
+
+        migrator.reset()
+
+        assert state_db.exists() is exists_after
         captured = capsys.readouterr()
-        assert "Reset cancelled" in captured.out
-
-    def test_reset_when_database_missing(self, monkeypatch, capsys, tmp_path, migrator):
-        """Test reset when database doesn't exist."""
-        _override_state_db(tmp_path, monkeypatch, create=False)
-
-        with mock.patch("builtins.input", return_value="yes"):
-            migrator.reset()
-
-        captured = capsys.readouterr()
-        assert "Created fresh state database" in captured.out
-
-    def test_reset_case_insensitive_confirmation(self, monkeypatch, tmp_path, migrator):
-        """Test reset accepts case-insensitive 'YES'."""
-        state_db = _override_state_db(tmp_path, monkeypatch, create=True)
-
-        with mock.patch("builtins.input", return_value="YES"):
-            migrator.reset()
-
-        assert state_db.exists()
-
-    def test_reset_prints_header_message(self, monkeypatch, capsys, tmp_path, migrator):
-        """Test reset prints header message."""
-        _override_state_db(tmp_path, monkeypatch, create=False)
-
-        with mock.patch("builtins.input", return_value="no"):
-            migrator.reset()
-
-        captured = capsys.readouterr()
-        assert "RESET MIGRATION" in captured.out
-        assert "delete all migration state" in captured.out
+        for needle in expected_output:
+            assert needle in captured.out
 
 
 class TestRunPhaseSkipping:
     """Ensure run() skips irrelevant phases."""
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}()"
-
-    def test_run_skips_scanner_in_middle_phases(self, migrator, mock_dependencies):
+    def test_run_skips_scanner_in_middle_phases(self, migrator, mock_dependencies, patched_phases):
         """Test that scanner is skipped when starting in middle phase."""
         mock_state = mock_dependencies["state"]
-        mock_state.get_current_phase.side_effect = [Phase.GLACIER_RESTORE, Phase.COMPLETE]
-        called = []
-
-        with pytest.MonkeyPatch.context() as mp:
-            mp.setattr("migrate_v2.scan_all_buckets", lambda s3, state, interrupted: called.append("scan"))
-            mp.setattr("migrate_v2.request_all_restores", lambda s3, state, interrupted: called.append("restore"))
-            mp.setattr("migrate_v2.wait_for_restores", lambda s3, state, interrupted: called.append("wait"))
-            mp.setattr("migrate_v2.migrate_all_buckets", lambda s3, state, base_path, drive_checker, interrupted: called.append("migrate"))
-            mp.setattr("migrate_v2.check_drive_available", lambda base_path: None)
-            mp.setattr("shutil.which", lambda cmd: "/usr/bin/aws")
-            migrator.run()
+        mock_state.get_current_phase.side_effect = RESTORE_PHASE_SEQUENCE
 
-        assert "scan" not in called
-        assert "restore" in called
+        migrator.run()
+
+        assert "scan" not in patched_phases
+        assert "restore" in patched_phases
 
 
 class TestRunPhaseTransitions:
     """Validate run() transitions through expected phases."""
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}()"
-
-    def test_run_completes_all_phase_transitions(self, migrator, mock_dependencies):
+    def test_run_completes_all_phase_transitions(self, migrator, mock_dependencies, patched_phases):
         """Test that all migration phases are executed in correct order."""
         mock_state = mock_dependencies["state"]
-        mock_state.get_current_phase.side_effect = [
-            Phase.SCANNING,
-            Phase.GLACIER_RESTORE,
-            Phase.GLACIER_WAIT,
-            Phase.SYNCING,
-            Phase.COMPLETE,
-        ]
-        called = []
-
-        with pytest.MonkeyPatch.context() as mp:
-            mp.setattr("migrate_v2.scan_all_buckets", lambda s3, state, interrupted: called.append("scan"))
-            mp.setattr("migrate_v2.request_all_restores", lambda s3, state, interrupted: called.append("restore"))
-            mp.setattr("migrate_v2.wait_for_restores", lambda s3, state, interrupted: called.append("wait"))
-            mp.setattr("migrate_v2.migrate_all_buckets", lambda s3, state, base_path, drive_checker, interrupted: called.append("migrate"))
-            mp.setattr("migrate_v2.check_drive_available", lambda base_path: None)
-            mp.setattr("shutil.which", lambda cmd: "/usr/bin/aws")
-            migrator.run()
+        mock_state.get_current_phase.side_effect = FULL_PHASE_SEQUENCE
 
-        assert "scan" in called
-        assert "restore" in called
-        assert "wait" in called
-        assert "migrate" in called
+        migrator.run()
+
+        assert patched_phases == ["scan", "restore", "wait", "migrate"]
 
 
 class TestS3MigrationV2ErrorHandling:
     """Drive checker and other failure scenarios."""
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}()"
-
-    def test_run_with_drive_check_failure(self, migrator, mock_dependencies):
+    def test_run_with_drive_check_failure(self, migrator, monkeypatch):
         """Test that SystemExit from drive check is propagated."""
-        with (
-            pytest.raises(SystemExit),
-            pytest.MonkeyPatch.context() as mp,
-        ):
-            mp.setattr("migrate_v2.check_drive_available", mock.Mock(side_effect=SystemExit(1)))
-            mp.setattr("shutil.which", lambda cmd: "/usr/bin/aws")
+        monkeypatch.setattr("migrate_v2.check_drive_available", mock.Mock(side_effect=SystemExit(1)))
+
+        with pytest.raises(SystemExit):
             migrator.run()
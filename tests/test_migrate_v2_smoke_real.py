@@ -10,7 +10,7 @@ from types import SimpleNamespace
 import pytest
 
 import migrate_v2_smoke_real as real
-from migrate_v2_smoke_shared import SmokeTestDeps, materialize_sample_tree
+from migrate_v2_smoke_shared import SmokeTestDeps, manifest_directory, materialize_sample_tree
 
 
 class _FakeWaiter:
@@ -93,7 +93,21 @@ class _FakeMigrator:
         return f"_FakeMigrator(ran={self.ran})"
 
 
-def _make_deps(tmp_path, fake_s3, monkeypatch):
+@pytest.fixture(autouse=True)
+def restore_builtin_input(monkeypatch):
+    """Undo the auto-confirming input() that seed_real_bucket installs."""
+    monkeypatch.setattr(builtins, "input", builtins.input)
+
+
+@pytest.fixture
+def fake_s3():
+    """Recording S3 client shared by a test and its smoke_deps."""
+    return _FakeS3()
+
+
+@pytest.fixture
+def smoke_deps(tmp_path, fake_s3, monkeypatch):
+    """Smoke test dependencies wired to fake_s3, returned with their fake migrator."""
     base_path = tmp_path / "drive"
     base_path.mkdir()
     config = SimpleNamespace(
@@ -124,45 +138,34 @@ def _make_deps(tmp_path, fake_s3, monkeypatch):
     return deps, migrator
 
 
-def testseed_real_bucket_updates_config(monkeypatch, tmp_path):
+def testseed_real_bucket_updates_config(smoke_deps, fake_s3):
     """Test that seeding real bucket updates config."""
-    fake_s3 = _FakeS3()
-    deps, _ = _make_deps(tmp_path, fake_s3, monkeypatch)
+    deps, _ = smoke_deps
     ctx = real.RealSmokeContext.create(deps)
     fake_s3.bucket_name = ctx.bucket_name
-    original_input = builtins.input
-    try:
-        stats = real.seed_real_bucket(ctx)
-    finally:
-        builtins.input = original_input
+    stats = real.seed_real_bucket(ctx)
     assert stats.files_created > 0
     assert deps.config.STATE_DB_PATH == str(ctx.state_db_path)
     assert ctx.bucket_name not in deps.config.EXCLUDED_BUCKETS
     assert fake_s3.put_calls  # ensure uploads occurred
 
 
-def testrun_real_workflow_removes_local_data(monkeypatch, tmp_path):
+def testrun_real_workflow_removes_local_data(smoke_deps):
     """Test that workflow removes local data after migration."""
-    fake_s3 = _FakeS3()
-    deps, migrator = _make_deps(tmp_path, fake_s3, monkeypatch)
+    deps, migrator = smoke_deps
     ctx = real.RealSmokeContext.create(deps)
-    fake_s3.bucket_name = ctx.bucket_name
-    original_input = builtins.input
-    try:
-        stats = real.seed_real_bucket(ctx)
-    finally:
-        builtins.input = original_input
-    ctx.local_bucket_path.mkdir(parents=True, exist_ok=True)
-    materialize_sample_tree(ctx.local_bucket_path)
+    ctx.local_bucket_path.mkdir(parents=True)
+    (ctx.local_bucket_path / "dummy.txt").write_bytes(b"x")
+    manifest = manifest_directory(ctx.local_bucket_path)
+    stats = real.RealSmokeStats(files_created=1, dirs_created=1, total_bytes=1, manifest_expected=manifest)
     real.run_real_workflow(ctx, stats)
     assert migrator.ran
     assert not ctx.local_bucket_path.exists()
 
 
-def testprint_real_report_outputs_sections(capsys, monkeypatch, tmp_path):
+def testprint_real_report_outputs_sections(capsys, smoke_deps):
     """Test that report printing outputs expected sections."""
-    fake_s3 = _FakeS3()
-    deps, _ = _make_deps(tmp_path, fake_s3, monkeypatch)
+    deps, _ = smoke_deps
     ctx = real.RealSmokeContext.create(deps)
     stats = real.RealSmokeStats(files_created=1, dirs_created=1, total_bytes=10, manifest_expected={})
     real.print_real_report(ctx, stats)
@@ -250,20 +253,12 @@ def test_context_restore_deletes_bucket_when_created(tmp_path):
     assert fake_s3.deleted_buckets[0]["Bucket"] == "test-bucket"
 
 
-def test_context_create_raises_when_path_exists(monkeypatch, tmp_path):
+def test_context_create_raises_when_path_exists(monkeypatch, smoke_deps):
     """Test that context creation raises when local bucket path already exists."""
-    fake_s3 = _FakeS3()
-    deps, _ = _make_deps(tmp_path, fake_s3, monkeypatch)
-    base_path = Path(deps.config.LOCAL_BASE_PATH)
-    # Create context once to get the bucket name pattern
-    ctx = real.RealSmokeContext.create(deps)
-    ctx.restore()
-
-    # Create a directory that will conflict
-    # We need to mock uuid to get a predictable bucket name
+    deps, _ = smoke_deps
     mock_uuid = SimpleNamespace(hex="12345678901234567890123456789012")
     monkeypatch.setattr(uuid_module, "uuid4", lambda: mock_uuid)
-    conflict_path = base_path / "migrate-v2-smoke-12345678901234567890123456789012"
+    conflict_path = Path(deps.config.LOCAL_BASE_PATH) / f"migrate-v2-smoke-{mock_uuid.hex}"
     conflict_path.mkdir(parents=True)
 
     with pytest.raises(RuntimeError, match="already exists"):
@@ -312,10 +307,9 @@ def test_delete_bucket_and_contents_with_versions():
     assert keys == {"file1.txt", "file2.txt", "deleted.txt"}
 
 
-def test_run_real_smoke_test_success(monkeypatch, tmp_path, capsys):
+def test_run_real_smoke_test_success(monkeypatch, smoke_deps, capsys):
     """Test run_real_smoke_test completes successfully."""
-    fake_s3 = _FakeS3()
-    deps, migrator = _make_deps(tmp_path, fake_s3, monkeypatch)
+    deps, migrator = smoke_deps
     bucket_name_holder = []
 
     original_seed = real.seed_real_bucket
@@ -342,17 +336,12 @@ def test_run_real_smoke_test_success(monkeypatch, tmp_path, capsys):
     assert migrator.ran
 
 
-def test_run_real_workflow_raises_when_no_local_data(monkeypatch, tmp_path):
+def test_run_real_workflow_raises_when_no_local_data(smoke_deps, fake_s3):
     """Test run_real_workflow raises when no local data is created."""
-    fake_s3 = _FakeS3()
-    deps, _ = _make_deps(tmp_path, fake_s3, monkeypatch)
+    deps, _ = smoke_deps
     ctx = real.RealSmokeContext.create(deps)
     fake_s3.bucket_name = ctx.bucket_name
-    original_input = builtins.input
-    try:
-        stats = real.seed_real_bucket(ctx)
-    finally:
-        builtins.input = original_input
+    stats = real.seed_real_bucket(ctx)
 
     # Don't create local_bucket_path, so workflow should fail
     with pytest.raises(RuntimeError, match="Expected downloaded data"):
@@ -8,6 +8,7 @@ Tests cover:
 """
 
 from threading import Event
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
@@ -17,13 +18,15 @@ from migration_orchestrator import (
     process_bucket,
     show_verification_summary,
 )
+from migration_state_v2 import MigrationStateV2
+from tests.conftest_test_values import TEST_VERIFY_RESULTS
 
 
 @pytest.fixture
 def mock_dependencies(tmp_path):
     """Create mock dependencies for process_bucket"""
     mock_s3 = mock.Mock()
-    mock_state = mock.Mock()
+    mock_state = mock.Mock(spec=MigrationStateV2)
     base_path = tmp_path / "migration"
     base_path.mkdir()
 
@@ -34,10 +37,20 @@ def mock_dependencies(tmp_path):
     }
 
 
-def test_process_bucket_first_time_sync_verify_delete(mock_dependencies):
-    """Test process_bucket for first time: sync -> verify -> delete pipeline"""
-    bucket = "test-bucket"
-    bucket_info = {
+@pytest.fixture
+def bucket_ops(monkeypatch):
+    """Replace the sync/verify/delete steps with mocks and answer 'yes' to the delete prompt"""
+    ops = SimpleNamespace(sync=mock.Mock(), verify=mock.Mock(), delete=mock.Mock())
+    monkeypatch.setattr("migration_orchestrator.sync_bucket", ops.sync)
+    monkeypatch.setattr("migration_orchestrator.verify_bucket", ops.verify)
+    monkeypatch.setattr("migration_orchestrator.delete_bucket", ops.delete)
+    monkeypatch.setattr("builtins.input", lambda _prompt="": "yes")
+    return ops
+
+
+def _bucket_info(**overrides):
+    """Build a complete process_bucket state row for a 100-file bucket"""
+    info = {
         "sync_complete": False,
         "verify_complete": False,
         "delete_complete": False,
@@ -49,216 +62,82 @@ def test_process_bucket_first_time_sync_verify_delete(mock_dependencies):
         "checksum_verified_count": 100,
         "total_bytes_verified": 1024000,
     }
-    mock_dependencies["state"].get_bucket_info.return_value = bucket_info
-
-    verify_results = {
-        "verified_count": 100,
-        "size_verified": 100,
-        "checksum_verified": 100,
-        "total_bytes_verified": 1024000,
-        "local_file_count": 100,
-    }
-
-    with (
-        mock.patch("migration_orchestrator.sync_bucket") as mock_sync,
-        mock.patch("migration_orchestrator.verify_bucket", return_value=verify_results) as mock_verify,
-        mock.patch("migration_orchestrator.delete_bucket") as mock_delete,
-        mock.patch("builtins.input", return_value="yes"),
-    ):
-        process_bucket(mock_dependencies["s3"], mock_dependencies["state"], mock_dependencies["base_path"], bucket, Event())
-
-    # Verify sync was called
-    mock_sync.assert_called_once()
-    mock_dependencies["state"].mark_bucket_sync_complete.assert_called_once_with(bucket)
-
-    # Verify verification was called
-    mock_verify.assert_called_once()
-    assert mock_dependencies["state"].mark_bucket_verify_complete.called
-
-    # Verify deletion was called
-    mock_delete.assert_called_once()
-    mock_dependencies["state"].mark_bucket_delete_complete.assert_called_once_with(bucket)
-
-
-def test_process_bucket_already_synced_skips_sync(mock_dependencies):
-    """Test process_bucket skips sync if already complete"""
+    info.update(overrides)
+    return info
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expect_sync", "expect_verify", "expect_delete"),
+    [
+        pytest.param({}, True, True, True, id="first_time"),
+        pytest.param({"sync_complete": True}, False, True, True, id="already_synced"),
+        pytest.param(
+            {"sync_complete": True, "verify_complete": True, "delete_complete": True},
+            False,
+            False,
+            False,
+            id="already_deleted",
+        ),
+    ],
+)
+def test_process_bucket_runs_only_incomplete_steps(mock_dependencies, bucket_ops, overrides, expect_sync, expect_verify, expect_delete):
+    """Test process_bucket runs sync -> verify -> delete, skipping steps already complete"""
     bucket = "test-bucket"
-    bucket_info = {
-        "sync_complete": True,
-        "verify_complete": False,
-        "delete_complete": False,
-        "file_count": 50,
-        "total_size": 512000,
-        "local_file_count": 50,
-        "verified_file_count": 50,
-        "size_verified_count": 50,
-        "checksum_verified_count": 50,
-        "total_bytes_verified": 512000,
-    }
-    mock_dependencies["state"].get_bucket_info.return_value = bucket_info
+    state = mock_dependencies["state"]
+    state.get_bucket_info.return_value = _bucket_info(**overrides)
+    bucket_ops.verify.return_value = TEST_VERIFY_RESULTS
 
-    verify_results = {
-        "verified_count": 50,
-        "size_verified": 50,
-        "checksum_verified": 50,
-        "total_bytes_verified": 512000,
-        "local_file_count": 50,
-    }
-
-    with (
-        mock.patch("migration_orchestrator.sync_bucket") as mock_sync,
-        mock.patch("migration_orchestrator.verify_bucket", return_value=verify_results),
-        mock.patch("migration_orchestrator.delete_bucket"),
-        mock.patch("builtins.input", return_value="yes"),
-    ):
-        process_bucket(mock_dependencies["s3"], mock_dependencies["state"], mock_dependencies["base_path"], bucket, Event())
+    process_bucket(mock_dependencies["s3"], state, mock_dependencies["base_path"], bucket, Event())
 
-    # Verify sync was NOT called
-    mock_sync.assert_not_called()
+    assert bucket_ops.sync.called is expect_sync
+    assert state.mark_bucket_sync_complete.called is expect_sync
+    assert bucket_ops.verify.called is expect_verify
+    assert state.mark_bucket_verify_complete.called is expect_verify
+    assert bucket_ops.delete.called is expect_delete
+    assert state.mark_bucket_delete_complete.called is expect_delete
 
 
-def test_process_bucket_already_deleted_skips_delete(mock_dependencies):
-    """Test process_bucket skips delete if already complete"""
-    bucket = "test-bucket"
-    bucket_info = {
-        "sync_complete": True,
-        "verify_complete": True,
-        "delete_complete": True,
-        "file_count": 10,
-        "total_size": 102400,
-        "verified_file_count": 10,
-        "local_file_count": 10,
-        "size_verified_count": 10,
-        "checksum_verified_count": 10,
-        "total_bytes_verified": 102400,
-    }
-    mock_dependencies["state"].get_bucket_info.return_value = bucket_info
-
-    with (
-        mock.patch("migration_orchestrator.sync_bucket") as mock_sync,
-        mock.patch("migration_orchestrator.delete_bucket") as mock_delete,
-    ):
-        process_bucket(mock_dependencies["s3"], mock_dependencies["state"], mock_dependencies["base_path"], bucket, Event())
-
-    # Verify sync and delete were NOT called
-    mock_sync.assert_not_called()
-    mock_delete.assert_not_called()
-
-
-def test_process_bucket_already_verified_recomputes_stats(mock_dependencies):
+def test_process_bucket_already_verified_recomputes_stats(mock_dependencies, bucket_ops):
     """Test process_bucket re-verifies when verify_complete but missing stats"""
     bucket = "test-bucket"
-    bucket_info = {
-        "sync_complete": True,
-        "verify_complete": True,
-        "delete_complete": False,
-        "file_count": 75,
-        "total_size": 768000,
-        "verified_file_count": None,  # Missing stats
-        "local_file_count": 75,
-        "size_verified_count": 75,
-        "checksum_verified_count": 75,
-        "total_bytes_verified": 768000,
-    }
+    bucket_info = _bucket_info(sync_complete=True, verify_complete=True, verified_file_count=None)
     mock_dependencies["state"].get_bucket_info.return_value = bucket_info
-
-    verify_results = {
-        "verified_count": 75,
-        "size_verified": 75,
-        "checksum_verified": 75,
-        "total_bytes_verified": 768000,
-        "local_file_count": 75,
-    }
+    bucket_ops.verify.return_value = TEST_VERIFY_RESULTS
 
     # After verification, update bucket_info with verified stats
     def update_bucket_info_on_verify_complete(_bucket_name, **_kwargs):
-        bucket_info["verified_file_count"] = 75
+        bucket_info["verified_file_count"] = 100
 
     mock_dependencies["state"].mark_bucket_verify_complete.side_effect = update_bucket_info_on_verify_complete
 
-    with (
-        mock.patch("migration_orchestrator.sync_bucket") as mock_sync,
-        mock.patch("migration_orchestrator.verify_bucket", return_value=verify_results) as mock_verify,
-        mock.patch("migration_orchestrator.delete_bucket"),
-        mock.patch("builtins.input", return_value="yes"),
-    ):
-        process_bucket(mock_dependencies["s3"], mock_dependencies["state"], mock_dependencies["base_path"], bucket, Event())
+    process_bucket(mock_dependencies["s3"], mock_dependencies["state"], mock_dependencies["base_path"], bucket, Event())
 
     # Verify sync was NOT called, but verify was
-    mock_sync.assert_not_called()
-    mock_verify.assert_called_once()
+    bucket_ops.sync.assert_not_called()
+    bucket_ops.verify.assert_called_once()
 
 
-def test_delete_with_confirmation_user_confirms_yes(mock_dependencies):
+def test_delete_with_confirmation_user_confirms_yes(mock_dependencies, bucket_ops):
     """Test delete_with_confirmation when user inputs 'yes'"""
     bucket = "test-bucket"
-    bucket_info = {
-        "file_count": 100,
-        "total_size": 1024000,
-        "local_file_count": 100,
-        "verified_file_count": 100,
-        "size_verified_count": 100,
-        "checksum_verified_count": 100,
-        "total_bytes_verified": 1024000,
-    }
 
-    with (
-        mock.patch("migration_orchestrator.delete_bucket") as mock_delete,
-        mock.patch("builtins.input", return_value="yes"),
-    ):
-        delete_with_confirmation(mock_dependencies["s3"], mock_dependencies["state"], bucket, bucket_info)
+    delete_with_confirmation(mock_dependencies["s3"], mock_dependencies["state"], bucket, _bucket_info())
 
-    mock_delete.assert_called_once_with(mock_dependencies["s3"], mock_dependencies["state"], bucket)
+    bucket_ops.delete.assert_called_once_with(mock_dependencies["s3"], mock_dependencies["state"], bucket)
     mock_dependencies["state"].mark_bucket_delete_complete.assert_called_once_with(bucket)
 
 
-def test_delete_with_confirmation_user_confirms_no(mock_dependencies):
-    """Test delete_with_confirmation when user inputs 'no'"""
-    bucket = "test-bucket"
-    bucket_info = {
-        "file_count": 50,
-        "total_size": 512000,
-        "local_file_count": 50,
-        "verified_file_count": 50,
-        "size_verified_count": 50,
-        "checksum_verified_count": 50,
-        "total_bytes_verified": 512000,
-    }
+@pytest.mark.parametrize("answer", ["no", "maybe"])
+def test_delete_with_confirmation_skips_without_yes(mock_dependencies, bucket_ops, monkeypatch, answer):
+    """Test delete_with_confirmation leaves the bucket alone for any answer but 'yes'"""
+    monkeypatch.setattr("builtins.input", lambda _prompt="": answer)
 
-    with (
-        mock.patch("migration_orchestrator.delete_bucket") as mock_delete,
-        mock.patch("builtins.input", return_value="no"),
-    ):
-        delete_with_confirmation(mock_dependencies["s3"], mock_dependencies["state"], bucket, bucket_info)
+    delete_with_confirmation(mock_dependencies["s3"], mock_dependencies["state"], "test-bucket", _bucket_info())
 
-    # Verify deletion was NOT called
-    mock_delete.assert_not_called()
+    bucket_ops.delete.assert_not_called()
     mock_dependencies["state"].mark_bucket_delete_complete.assert_not_called()
 
 
-def test_delete_with_confirmation_user_confirms_other_input(mock_dependencies):
-    """Test delete_with_confirmation with non-yes, non-no input"""
-    bucket = "test-bucket"
-    bucket_info = {
-        "file_count": 75,
-        "total_size": 768000,
-        "local_file_count": 75,
-        "verified_file_count": 75,
-        "size_verified_count": 75,
-        "checksum_verified_count": 75,
-        "total_bytes_verified": 768000,
-    }
-
-    with (
-        mock.patch("migration_orchestrator.delete_bucket") as mock_delete,
-        mock.patch("builtins.input", return_value="maybe"),
-    ):
-        delete_with_confirmation(mock_dependencies["s3"], mock_dependencies["state"], bucket, bucket_info)
-
-    # Verify deletion was NOT called for non-yes input
-    mock_delete.assert_not_called()
-
-
 def test_show_verification_summary_formats_output():
     """Test show_verification_summary displays all stats correctly"""
     bucket_info = {
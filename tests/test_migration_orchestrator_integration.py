@@ -16,13 +16,15 @@ from migration_orchestrator import (
     migrate_all_buckets,
     process_bucket,
 )
+from migration_state_v2 import MigrationStateV2
+from tests.conftest_test_values import TEST_VERIFY_RESULTS
 
 
 @pytest.fixture
 def mock_deps(tmp_path):
     """Create mock dependencies for integration tests"""
     mock_s3 = mock.Mock()
-    mock_state = mock.Mock()
+    mock_state = mock.Mock(spec=MigrationStateV2)
     mock_drive_checker = mock.Mock()
     base_path = tmp_path / "migration"
     base_path.mkdir()
@@ -35,7 +37,7 @@ def mock_deps(tmp_path):
     }
 
 
-def test_full_bucket_migration_pipeline(mock_deps):
+def test_full_bucket_migration_pipeline(mock_deps, monkeypatch):
     """Test complete migration pipeline: sync -> verify -> delete"""
     bucket = "test-bucket"
     bucket_info = {
@@ -43,28 +45,20 @@ def test_full_bucket_migration_pipeline(mock_deps):
         "verify_complete": False,
         "delete_complete": False,
         "file_count": 100,
-        "total_size": 1000000,
+        "total_size": 1024000,
         "local_file_count": 100,
         "verified_file_count": 100,
         "size_verified_count": 100,
         "checksum_verified_count": 100,
-        "total_bytes_verified": 1000000,
+        "total_bytes_verified": 1024000,
     }
     mock_deps["state"].get_bucket_info.return_value = bucket_info
-
-    verify_results = {
-        "verified_count": 100,
-        "size_verified": 100,
-        "checksum_verified": 100,
-        "total_bytes_verified": 1000000,
-        "local_file_count": 100,
-    }
+    monkeypatch.setattr("builtins.input", lambda _prompt="": "yes")
 
     with (
         mock.patch("migration_orchestrator.sync_bucket") as mock_sync,
-        mock.patch("migration_orchestrator.verify_bucket", return_value=verify_results) as mock_verify,
+        mock.patch("migration_orchestrator.verify_bucket", return_value=TEST_VERIFY_RESULTS) as mock_verify,
         mock.patch("migration_orchestrator.delete_bucket") as mock_delete,
-        mock.patch("builtins.input", return_value="yes"),
     ):
         process_bucket(mock_deps["s3"], mock_deps["state"], mock_deps["base_path"], bucket, Event())
 
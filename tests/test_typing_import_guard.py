@@ -0,0 +1,31 @@
+"""Guard against typing-only imports leaking into test-suite import time."""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+RUNTIME_TYPING_NAMES = {"TYPE_CHECKING", "cast", "NamedTuple", "TypedDict", "Protocol"}
+
+
+def _runtime_typing_imports(tree: ast.Module) -> list[tuple[int, str]]:
+    """Module-level typing imports outside ``if TYPE_CHECKING:`` that are only needed by annotations."""
+    offending = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            offending.extend((node.lineno, alias.name) for alias in node.names if alias.name == "typing")
+        elif isinstance(node, ast.ImportFrom) and node.module == "typing":
+            offending.extend((node.lineno, alias.name) for alias in node.names if alias.name not in RUNTIME_TYPING_NAMES)
+    return offending
+
+
+def test_typing_imports_are_deferred_to_type_checking():
+    """With postponed annotations, annotation-only imports belong under ``if TYPE_CHECKING:``."""
+    violations = []
+    for path in sorted(TESTS_DIR.rglob("*.py")):
+        source = path.read_text(encoding="utf-8")
+        if "typing" not in source:
+            continue
+        violations.extend(f"{path.name}:{lineno} ({name})" for lineno, name in _runtime_typing_imports(ast.parse(source)))
+    assert not violations, "Move annotation-only imports under TYPE_CHECKING: " + ", ".join(violations)